@@ -7,11 +7,13 @@ from alembic import context
 import os
 import sys
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+# Add the src directory to the path so the package is imported once, as
+# doc_healing; importing it as src.doc_healing would load a second copy whose
+# Base carries none of the mapped tables
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from src.doc_healing.db.base import Base
-from src.doc_healing.db.models import (
+from doc_healing.db.base import Base
+from doc_healing.db.models import (
     Repository,
     PullRequest,
     ValidationWorkflowDB,
@@ -7,7 +7,8 @@ import os
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from doc_healing.db.base import engine, Base
+from doc_healing.db.base import create_missing_tables
+from doc_healing.db.connection import get_engine
 from doc_healing.db.models import (
     Repository,
     PullRequest,
@@ -25,8 +26,19 @@ from doc_healing.db.models import (
 def init_db() -> None:
     """Initialize the database."""
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    print("Database tables created successfully!")
+    engine = get_engine()
+    # One transaction (and one commit fsync) covers all DDL; it is idempotent
+    # and recoverable from the models, so durability can be relaxed meanwhile
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql("SET LOCAL synchronous_commit = OFF")
+        elif conn.dialect.name == "sqlite":
+            # journal_mode is left alone: the engine keeps SQLite in WAL
+            conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        created = create_missing_tables(conn)
+    # Drop the tuned connections so nothing else inherits the relaxed settings
+    engine.dispose()
+    print(f"Database tables created successfully! ({len(created)} new)")
 
 
 if __name__ == "__main__":
@@ -15,11 +15,11 @@ logger = logging.getLogger(__name__)
 
 def migrate_data(postgres_url: str, sqlite_url: str) -> bool:
     """Migrate data from PostgreSQL to SQLite."""
-    logger.info(f"Connecting to Source PostgreSQL: {postgres_url}")
+    logger.info("Connecting to Source PostgreSQL: %s", postgres_url)
     source_engine = create_engine(postgres_url)
     SourceSession = sessionmaker(bind=source_engine)
     
-    logger.info(f"Connecting to Target SQLite: {sqlite_url}")
+    logger.info("Connecting to Target SQLite: %s", sqlite_url)
     target_engine = create_engine(sqlite_url)
     TargetSession = sessionmaker(bind=target_engine)
     
@@ -34,14 +34,14 @@ def migrate_data(postgres_url: str, sqlite_url: str) -> bool:
         records_migrated = 0
         
         for name, table in Base.metadata.tables.items():
-            logger.info(f"Migrating table: {name}")
+            logger.info("Migrating table: %s", name)
             
             # Read all rows from source
             result = source_engine.execute(table.select())
             rows = result.fetchall()
             
             if not rows:
-                logger.info(f"  Table {name} is empty, skipping.")
+                logger.info("  Table %s is empty, skipping.", name)
                 continue
             
             dicts = [dict(row) for row in rows]
@@ -49,14 +49,14 @@ def migrate_data(postgres_url: str, sqlite_url: str) -> bool:
             
             tables_migrated += 1
             records_migrated += len(rows)
-            logger.info(f"  Migrated {len(rows)} records for {name}")
+            logger.info("  Migrated %d records for %s", len(rows), name)
             
         target_session.commit()
-        logger.info(f"Migration successful: {records_migrated} records across {tables_migrated} tables.")
+        logger.info("Migration successful: %d records across %d tables.", records_migrated, tables_migrated)
         return True
         
     except Exception as e:
-        logger.error(f"Migration failed: {e}")
+        logger.error("Migration failed: %s", e)
         target_session.rollback()
         return False
     finally:
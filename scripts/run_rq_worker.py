@@ -13,35 +13,42 @@ import logging
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
 
-from doc_healing.config import get_settings
+from doc_healing.config import Settings, get_settings
+from doc_healing.queue.redis_client import create_connection_pool
+from doc_healing.queue.serializer import OrjsonSerializer
 from redis import Redis
-from rq import Worker, Queue, Connection
+from rq import Worker
+
+def run_worker(settings: Settings, queues: list) -> None:
+    """Run an RQ worker against the Redis instance described by ``settings``."""
+    if settings.redis_unix_socket:
+        logger.info("Starting RQ Worker connecting to Redis socket %s", settings.redis_unix_socket)
+    elif settings.redis_url:
+        logger.info("Starting RQ Worker connecting to Redis URL")
+    else:
+        logger.info("Starting RQ Worker connecting to %s:%s", settings.redis_host, settings.redis_port)
+    
+    try:
+        redis_conn = Redis(connection_pool=create_connection_pool(settings, long_polling=True))
+        worker = Worker(queues, connection=redis_conn, serializer=OrjsonSerializer)
+        worker.work()
+    except Exception as e:
+        logger.error("Error running RQ worker: %s", e)
+        sys.exit(1)
 
 def main():
-    # Calling get_settings() initializes the global configuration
-    # which includes authenticating with AWS Secrets Manager and overriding vars
+    # Calling get_settings() once initializes the configuration, including
+    # authenticating with AWS Secrets Manager and overriding vars. RQ's
+    # work horses are forked from this process and inherit the parsed settings.
     settings = get_settings()
     
-    if settings.redis_url:
-        redis_url = settings.redis_url
-        print(f"Starting RQ Worker connecting to Redis URL")
-    else:
-        redis_url = f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
-        print(f"Starting RQ Worker connecting to {settings.redis_host}:{settings.redis_port}")
-    
     # The arguments to pass to rq worker. We extract them from sys.argv
     # Typically this is called as: python scripts/run_rq_worker.py webhooks validation healing
     queues = sys.argv[1:] if len(sys.argv) > 1 else ["webhooks", "validation", "healing"]
     
-    try:
-        redis_conn = Redis.from_url(redis_url)
-        with Connection(redis_conn):
-            worker = Worker(queues)
-            worker.work()
-    except Exception as e:
-        print(f"Error running RQ worker: {e}")
-        sys.exit(1)
+    run_worker(settings, queues)
 
 if __name__ == "__main__":
     main()
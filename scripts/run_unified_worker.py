@@ -18,8 +18,9 @@ import os
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from doc_healing.config import get_settings
 from doc_healing.workers.unified import main
 
 
 if __name__ == "__main__":
-    main()
+    main(get_settings())
@@ -4,12 +4,19 @@
 import sys
 import os
 import argparse
+import logging
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from redis import Redis
 from rq import Worker
-from doc_healing.queue.redis_client import get_redis_client
+from doc_healing.config import get_settings
+from doc_healing.queue.redis_client import create_connection_pool
+from doc_healing.queue.serializer import OrjsonSerializer
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
 
 
 def main() -> None:
@@ -22,10 +29,11 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    redis_client = get_redis_client()
-    worker = Worker([args.queue], connection=redis_client)
+    # Workers block on BLPOP, so they get a pool without a short socket timeout
+    redis_client = Redis(connection_pool=create_connection_pool(get_settings(), long_polling=True))
+    worker = Worker([args.queue], connection=redis_client, serializer=OrjsonSerializer)
     
-    print(f"Starting worker for queue: {args.queue}")
+    logger.info("Starting worker for queue: %s", args.queue)
     worker.work()
 
 
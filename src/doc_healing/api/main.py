@@ -1,18 +1,35 @@
 """Main FastAPI application."""
 
+import asyncio
+import hashlib
+import hmac
 import logging
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, Any
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, HTMLResponse
+from typing import Any, Callable, Dict
+import orjson
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, HTMLResponse, ORJSONResponse
+from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, ValidationError
 
-from doc_healing.config import get_settings
-from doc_healing.db.connection import engine
-from doc_healing.db.base import Base
+from doc_healing.config import DatabaseBackend, get_settings
+from doc_healing.db.connection import get_engine
+from doc_healing.db.base import create_missing_tables
 from doc_healing.monitoring.memory import log_memory_usage
+from doc_healing.queue.base import QueueBackend
+from doc_healing.queue.factory import get_queue_backend
+from doc_healing.workers.tasks import (
+    heal_code_snippet,
+    heal_documentation_file,
+    process_github_webhook,
+    process_gitlab_webhook,
+    validate_code_snippet,
+    validate_documentation_file,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -57,11 +74,46 @@ tags_metadata = [
     {"name": "Health", "description": "Service health and status endpoints"},
 ]
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize application on startup."""
+    settings = get_settings()
+    
+    # Log deployment configuration
+    logger.info(f"Starting API in {settings.deployment_mode.value} mode")
+    logger.info(f"Database backend: {settings.database_backend.value}")
+    logger.info(f"Queue backend: {settings.queue_backend.value}")
+    
+    # Log database connection details
+    if settings.database_backend.value == "sqlite":
+        logger.info(f"SQLite database path: {settings.sqlite_path}")
+    else:
+        logger.info(f"PostgreSQL database URL: {settings.database_url}")
+    
+    # PostgreSQL schemas are managed offline (init_db.py / Alembic); SQLite has
+    # no separate migration step, so lightweight mode bootstraps its own tables
+    if settings.auto_create_schema or settings.database_backend == DatabaseBackend.SQLITE:
+        logger.info("Initializing database schema...")
+        with get_engine().begin() as conn:
+            create_missing_tables(conn)
+        logger.info("Database schema initialized successfully")
+    
+    # Resolve the queue backend once; handlers read it from app.state
+    app.state.queue = get_queue_backend()
+    
+    # Log memory metrics
+    log_memory_usage(context="server_startup")
+    
+    yield
+
+
 app = FastAPI(
     title="🏜️ OASIS — Self-Healing Documentation Engine",
     description=description,
     version="0.1.0",
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Mount static files (CSS, JS)
@@ -72,7 +124,13 @@ if static_dir.exists():
 
 # Request/Response Models
 class WebhookPayload(BaseModel):
-    """Generic webhook payload model."""
+    """Generic webhook payload model.
+    
+    Provider-specific fields are kept as extras so the full payload
+    reaches the worker task.
+    """
+    model_config = ConfigDict(extra="allow")
+    
     event_type: str | None = None
     object_kind: str | None = None
     data: Dict[str, Any] = {}
@@ -114,30 +172,21 @@ class TaskResponse(BaseModel):
     queue_name: str
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup."""
-    settings = get_settings()
+def _task_response(task_id: str, queue_name: str) -> ORJSONResponse:
+    """Serialize an enqueue acknowledgement directly, bypassing response_model validation.
     
-    # Log deployment configuration
-    logger.info(f"Starting API in {settings.deployment_mode.value} mode")
-    logger.info(f"Database backend: {settings.database_backend.value}")
-    logger.info(f"Queue backend: {settings.queue_backend.value}")
-    
-    # Log database connection details
-    if settings.database_backend.value == "sqlite":
-        logger.info(f"SQLite database path: {settings.sqlite_path}")
-    else:
-        logger.info(f"PostgreSQL database URL: {settings.database_url}")
-    
-    # Initialize database schema (create tables if they don't exist)
-    # This is especially important for SQLite support
-    logger.info("Initializing database schema...")
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database schema initialized successfully")
-    
-    # Log memory metrics
-    log_memory_usage(context="server_startup")
+    TaskResponse stays declared on the routes so the OpenAPI schema is unchanged.
+    """
+    return ORJSONResponse({"task_id": task_id, "status": "queued", "queue_name": queue_name})
+
+
+def get_queue(request: Request) -> QueueBackend:
+    """Dependency returning the queue backend cached on the application state."""
+    queue = getattr(request.app.state, "queue", None)
+    if queue is None:
+        # Startup events do not run for clients created outside a lifespan context
+        queue = request.app.state.queue = get_queue_backend()
+    return queue
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -157,16 +206,39 @@ async def health() -> JSONResponse:
 
 # Webhook Endpoints
 
-@app.post("/webhooks/github", response_model=TaskResponse)
-async def handle_github_webhook(request: Request) -> TaskResponse:
+class ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route that parses request bodies with orjson (webhook payloads are large)."""
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
+webhooks_router = APIRouter(route_class=ORJSONRoute)
+
+
+@webhooks_router.post("/webhooks/github", response_model=TaskResponse)
+async def handle_github_webhook(
+    request: Request, queue: QueueBackend = Depends(get_queue)
+) -> ORJSONResponse:
     """Handle GitHub webhook events with signature verification.
     
     Verifies the X-Hub-Signature-256 header, then enqueues a task
     to process the GitHub webhook payload.
     """
-    import hashlib
-    import hmac
-    
     settings = get_settings()
     body = await request.body()
     
@@ -181,84 +253,75 @@ async def handle_github_webhook(request: Request) -> TaskResponse:
             logger.warning("Invalid webhook signature")
             raise HTTPException(status_code=401, detail="Invalid signature")
     
-    import json as json_mod
-    payload = json_mod.loads(body)
+    try:
+        payload = WebhookPayload.model_validate_json(body).model_dump(exclude_unset=True)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
     
     try:
-        # Lazy import to avoid Windows fork context issues
-        from doc_healing.queue.factory import get_queue_backend
-        from doc_healing.workers.tasks import process_github_webhook
-        
-        queue = get_queue_backend()
-        task = queue.enqueue("webhooks", process_github_webhook, payload)
+        task = await asyncio.to_thread(queue.enqueue, "webhooks", process_github_webhook, payload)
         logger.info(f"Enqueued GitHub webhook task: {task.id}")
-        return TaskResponse(
-            task_id=task.id,
-            status="queued",
-            queue_name="webhooks"
-        )
+        return _task_response(task.id, "webhooks")
     except Exception as e:
         logger.error(f"Failed to enqueue GitHub webhook: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to enqueue webhook: {str(e)}")
 
 
-@app.post("/webhooks/gitlab", response_model=TaskResponse)
-async def handle_gitlab_webhook(payload: Dict[str, Any]) -> TaskResponse:
+@webhooks_router.post("/webhooks/gitlab", response_model=TaskResponse)
+async def handle_gitlab_webhook(
+    payload: WebhookPayload, queue: QueueBackend = Depends(get_queue)
+) -> ORJSONResponse:
     """Handle GitLab webhook events.
     
     Enqueues a task to process the GitLab webhook payload.
     
     Args:
         payload: The webhook payload from GitLab
+        queue: Queue backend cached on the application state
         
     Returns:
-        TaskResponse with task_id and status
+        Task details (task_id, status, queue_name) matching TaskResponse
         
     Raises:
         HTTPException: If enqueuing fails
     """
     try:
-        # Lazy import to avoid Windows fork context issues
-        from doc_healing.queue.factory import get_queue_backend
-        from doc_healing.workers.tasks import process_gitlab_webhook
-        
-        queue = get_queue_backend()
-        task = queue.enqueue("webhooks", process_gitlab_webhook, payload)
-        logger.info(f"Enqueued GitLab webhook task: {task.id}")
-        return TaskResponse(
-            task_id=task.id,
-            status="queued",
-            queue_name="webhooks"
+        task = await asyncio.to_thread(
+            queue.enqueue, "webhooks", process_gitlab_webhook, payload.model_dump(exclude_unset=True)
         )
+        logger.info(f"Enqueued GitLab webhook task: {task.id}")
+        return _task_response(task.id, "webhooks")
     except Exception as e:
         logger.error(f"Failed to enqueue GitLab webhook: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to enqueue webhook: {str(e)}")
 
 
+app.include_router(webhooks_router)
+
+
 # Validation Endpoints
 
 @app.post("/validate/snippet", response_model=TaskResponse)
-async def validate_snippet(request: ValidationRequest) -> TaskResponse:
+async def validate_snippet(
+    request: ValidationRequest, queue: QueueBackend = Depends(get_queue)
+) -> ORJSONResponse:
     """Validate a code snippet.
     
     Enqueues a task to validate a code snippet from documentation.
     
     Args:
         request: ValidationRequest with file_path, snippet_id, code, and language
+        queue: Queue backend cached on the application state
         
     Returns:
-        TaskResponse with task_id and status
+        Task details (task_id, status, queue_name) matching TaskResponse
         
     Raises:
         HTTPException: If enqueuing fails
     """
     try:
-        # Lazy import to avoid Windows fork context issues
-        from doc_healing.queue.factory import get_queue_backend
-        from doc_healing.workers.tasks import validate_code_snippet
-        
-        queue = get_queue_backend()
-        task = queue.enqueue(
+        task = await asyncio.to_thread(
+            queue.enqueue,
             "validation",
             validate_code_snippet,
             request.file_path,
@@ -267,49 +330,40 @@ async def validate_snippet(request: ValidationRequest) -> TaskResponse:
             request.language
         )
         logger.info(f"Enqueued code snippet validation task: {task.id}")
-        return TaskResponse(
-            task_id=task.id,
-            status="queued",
-            queue_name="validation"
-        )
+        return _task_response(task.id, "validation")
     except Exception as e:
         logger.error(f"Failed to enqueue validation: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to enqueue validation: {str(e)}")
 
 
 @app.post("/validate/file", response_model=TaskResponse)
-async def validate_file(request: FileValidationRequest) -> TaskResponse:
+async def validate_file(
+    request: FileValidationRequest, queue: QueueBackend = Depends(get_queue)
+) -> ORJSONResponse:
     """Validate all code snippets in a documentation file.
     
     Enqueues a task to validate all code snippets in a documentation file.
     
     Args:
         request: FileValidationRequest with file_path and content
+        queue: Queue backend cached on the application state
         
     Returns:
-        TaskResponse with task_id and status
+        Task details (task_id, status, queue_name) matching TaskResponse
         
     Raises:
         HTTPException: If enqueuing fails
     """
     try:
-        # Lazy import to avoid Windows fork context issues
-        from doc_healing.queue.factory import get_queue_backend
-        from doc_healing.workers.tasks import validate_documentation_file
-        
-        queue = get_queue_backend()
-        task = queue.enqueue(
+        task = await asyncio.to_thread(
+            queue.enqueue,
             "validation",
             validate_documentation_file,
             request.file_path,
             request.content
         )
         logger.info(f"Enqueued file validation task: {task.id}")
-        return TaskResponse(
-            task_id=task.id,
-            status="queued",
-            queue_name="validation"
-        )
+        return _task_response(task.id, "validation")
     except Exception as e:
         logger.error(f"Failed to enqueue file validation: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to enqueue validation: {str(e)}")
@@ -318,27 +372,26 @@ async def validate_file(request: FileValidationRequest) -> TaskResponse:
 # Healing Endpoints
 
 @app.post("/heal/snippet", response_model=TaskResponse)
-async def heal_snippet(request: HealingRequest) -> TaskResponse:
+async def heal_snippet(
+    request: HealingRequest, queue: QueueBackend = Depends(get_queue)
+) -> ORJSONResponse:
     """Heal a code snippet that failed validation.
     
     Enqueues a task to automatically fix a code snippet.
     
     Args:
         request: HealingRequest with file_path, snippet_id, code, language, and errors
+        queue: Queue backend cached on the application state
         
     Returns:
-        TaskResponse with task_id and status
+        Task details (task_id, status, queue_name) matching TaskResponse
         
     Raises:
         HTTPException: If enqueuing fails
     """
     try:
-        # Lazy import to avoid Windows fork context issues
-        from doc_healing.queue.factory import get_queue_backend
-        from doc_healing.workers.tasks import heal_code_snippet
-        
-        queue = get_queue_backend()
-        task = queue.enqueue(
+        task = await asyncio.to_thread(
+            queue.enqueue,
             "healing",
             heal_code_snippet,
             request.file_path,
@@ -348,49 +401,40 @@ async def heal_snippet(request: HealingRequest) -> TaskResponse:
             request.errors
         )
         logger.info(f"Enqueued code snippet healing task: {task.id}")
-        return TaskResponse(
-            task_id=task.id,
-            status="queued",
-            queue_name="healing"
-        )
+        return _task_response(task.id, "healing")
     except Exception as e:
         logger.error(f"Failed to enqueue healing: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to enqueue healing: {str(e)}")
 
 
 @app.post("/heal/file", response_model=TaskResponse)
-async def heal_file(request: FileHealingRequest) -> TaskResponse:
+async def heal_file(
+    request: FileHealingRequest, queue: QueueBackend = Depends(get_queue)
+) -> ORJSONResponse:
     """Heal all invalid code snippets in a documentation file.
     
     Enqueues a task to automatically fix all invalid code snippets in a file.
     
     Args:
         request: FileHealingRequest with file_path and validation_results
+        queue: Queue backend cached on the application state
         
     Returns:
-        TaskResponse with task_id and status
+        Task details (task_id, status, queue_name) matching TaskResponse
         
     Raises:
         HTTPException: If enqueuing fails
     """
     try:
-        # Lazy import to avoid Windows fork context issues
-        from doc_healing.queue.factory import get_queue_backend
-        from doc_healing.workers.tasks import heal_documentation_file
-        
-        queue = get_queue_backend()
-        task = queue.enqueue(
+        task = await asyncio.to_thread(
+            queue.enqueue,
             "healing",
             heal_documentation_file,
             request.file_path,
             request.validation_results
         )
         logger.info(f"Enqueued file healing task: {task.id}")
-        return TaskResponse(
-            task_id=task.id,
-            status="queued",
-            queue_name="healing"
-        )
+        return _task_response(task.id, "healing")
     except Exception as e:
         logger.error(f"Failed to enqueue file healing: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to enqueue healing: {str(e)}")
@@ -0,0 +1,78 @@
+"""Bounded result caches shared by the LLM client and worker tasks."""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from doc_healing.config import QueueBackend, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Bounded LRU of string results, backed by Redis when it is the queue backend.
+
+    RQ runs each job in a forked work horse, so the in-process LRU only
+    outlives a job in the unified worker; Redis shares hits across all
+    workers. Redis errors are logged and treated as misses.
+
+    Args:
+        namespace: Redis key segment keeping this cache's entries apart
+        maxsize: Entries kept in the in-process LRU
+        ttl: Seconds an entry lives in Redis
+    """
+
+    def __init__(self, namespace: str, maxsize: int, ttl: int):
+        self._namespace = namespace
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._prefix = f"doc_healing:{namespace}:"
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _redis():
+        if get_settings().queue_backend != QueueBackend.REDIS:
+            return None
+        from doc_healing.queue.redis_client import get_redis_client
+        return get_redis_client()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+        try:
+            redis = self._redis()
+            raw = redis.get(self._prefix + key) if redis is not None else None
+        except Exception as e:
+            logger.warning(f"{self._namespace} cache lookup failed: {e}")
+            return None
+        if raw is None:
+            return None
+        # The shared Redis client returns bytes
+        value = raw.decode()
+        self._remember(key, value)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self._remember(key, value)
+        try:
+            redis = self._redis()
+            if redis is not None:
+                redis.set(self._prefix + key, value, ex=self._ttl)
+        except Exception as e:
+            logger.warning(f"{self._namespace} cache store failed: {e}")
+
+    def _remember(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
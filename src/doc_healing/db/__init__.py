@@ -1,7 +1,8 @@
 """Database configuration and models."""
 
 from doc_healing.db.base import Base
-from doc_healing.db.connection import get_db, engine
+from doc_healing.db.connection import get_db, get_engine
+from doc_healing.db.metrics import bulk_insert_metrics
 from doc_healing.db.models import (
     Repository,
     PullRequest,
@@ -18,7 +19,9 @@ from doc_healing.db.models import (
 __all__ = [
     "Base",
     "get_db",
+    "get_engine",
     "engine",
+    "bulk_insert_metrics",
     "Repository",
     "PullRequest",
     "ValidationWorkflowDB",
@@ -30,3 +33,10 @@ __all__ = [
     "CorrectionMetricsDB",
     "SystemMetricsDB",
 ]
+
+
+def __getattr__(name: str):
+    # The engine is created lazily on first access
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,29 @@
 """Database base configuration."""
 
+from typing import List
+
+from sqlalchemy import inspect
 from sqlalchemy.ext.declarative import declarative_base
 
 # Create base class for models
 Base = declarative_base()
+
+
+def create_missing_tables(bind) -> List[str]:
+    """Create the model tables that do not exist yet.
+
+    ``Base.metadata.create_all()`` probes the catalog with one ``has_table``
+    query per table; a single ``get_table_names()`` call answers the same
+    question for the whole schema. Models must be imported before calling.
+
+    Args:
+        bind: Engine or connection to create the tables on
+
+    Returns:
+        Names of the tables that were created
+    """
+    existing = set(inspect(bind).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    if missing:
+        Base.metadata.create_all(bind, tables=missing, checkfirst=False)
+    return [table.name for table in missing]
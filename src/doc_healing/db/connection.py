@@ -1,11 +1,13 @@
 """Database connection factory with backend support."""
 
+from functools import lru_cache
 from typing import Generator
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
 
-from doc_healing.config import get_settings, DatabaseBackend
+from doc_healing.config import Settings, get_settings, DatabaseBackend
 
 
 def get_database_url() -> str:
@@ -22,39 +24,90 @@ def get_database_url() -> str:
         return settings.database_url
 
 
+def _enable_sqlite_wal(dbapi_connection, connection_record) -> None:
+    """Let readers proceed while a writer holds the SQLite database."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+def _create_sqlite_engine(url: str, settings: Settings) -> Engine:
+    """Create a SQLite engine; file databases run in WAL mode."""
+    # Wait on locks instead of failing fast
+    connect_args = {"check_same_thread": False, "timeout": 30}
+    if settings.sqlite_path == ":memory:":
+        # Every pooled connection would otherwise get its own empty database
+        return create_engine(
+            url,
+            connect_args=connect_args,
+            poolclass=StaticPool,
+            echo=False
+        )
+    
+    engine = create_engine(
+        url,
+        connect_args=connect_args,
+        pool_pre_ping=True,
+        echo=False
+    )
+    event.listen(engine, "connect", _enable_sqlite_wal)
+    return engine
+
+
+def _create_postgresql_engine(url: str, settings: Settings) -> Engine:
+    """Create a pooled PostgreSQL engine sized from the worker thread count."""
+    # LIFO keeps bursts on a small set of warm connections so idle ones can age out
+    return create_engine(
+        url,
+        pool_size=settings.worker_threads * 2,
+        max_overflow=settings.worker_threads * 4,
+        pool_use_lifo=True,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        echo=False
+    )
+
+
+_ENGINE_FACTORIES = {
+    DatabaseBackend.SQLITE: _create_sqlite_engine,
+    DatabaseBackend.POSTGRESQL: _create_postgresql_engine,
+}
+
+
 def create_db_engine() -> Engine:
     """Create database engine with backend-specific configuration.
     
     Returns:
         Engine: SQLAlchemy engine configured for the selected backend
     """
-    url = get_database_url()
     settings = get_settings()
+    return _ENGINE_FACTORIES[settings.database_backend](get_database_url(), settings)
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Get the process-wide database engine, creating it on first use.
     
-    if settings.database_backend == DatabaseBackend.SQLITE:
-        # SQLite-specific configuration
-        engine = create_engine(
-            url,
-            connect_args={"check_same_thread": False},
-            pool_pre_ping=True,
-            echo=False
-        )
-    else:
-        # PostgreSQL-specific configuration with connection pooling
-        engine = create_engine(
-            url,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,
-            echo=False
-        )
-    
-    return engine
+    Returns:
+        Engine: Shared SQLAlchemy engine for the configured backend
+    """
+    return create_db_engine()
+
+
+@lru_cache(maxsize=1)
+def _session_factory() -> sessionmaker:
+    """Get the session factory bound to the shared engine."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
 
-# Create engine and session factory
-engine = create_db_engine()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def __getattr__(name: str):
+    # Keep ``connection.engine`` and ``connection.SessionLocal`` working
+    # without connecting at import time
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return _session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -63,7 +116,7 @@ def get_db() -> Generator[Session, None, None]:
     Yields:
         Session: SQLAlchemy database session
     """
-    db = SessionLocal()
+    db = _session_factory()()
     try:
         yield db
     finally:
@@ -0,0 +1,30 @@
+"""Bulk writes for the metrics tables."""
+
+from typing import Iterable, Mapping, Type
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from doc_healing.db.base import Base
+
+
+def bulk_insert_metrics(session: Session, model: Type[Base], rows: Iterable[Mapping]) -> int:
+    """Insert many metrics rows with a single executemany.
+
+    Skips the ORM unit of work and asks for no RETURNING, so SQLAlchemy can
+    batch the rows into multi-row INSERT statements (psycopg2 pages them
+    1000 rows per round trip).
+
+    Args:
+        session: Active database session; the caller commits
+        model: Mapped metrics class, e.g. ValidationMetricsDB
+        rows: Column-name mappings, one per row
+
+    Returns:
+        int: Number of rows inserted
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    session.execute(insert(model), rows)
+    return len(rows)
@@ -1,6 +1,5 @@
 """Database models using SQLAlchemy."""
 
-from datetime import datetime
 from sqlalchemy import (
     Column,
     Integer,
@@ -13,11 +12,36 @@ from sqlalchemy import (
     BigInteger,
     Numeric,
     JSON,
+    text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import configure_mappers, relationship
+from sqlalchemy.sql.expression import FunctionElement
 
 from doc_healing.db.base import Base
 
+# Stored as binary JSONB on PostgreSQL so reads skip re-parsing the text
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive TIMESTAMP, evaluated by the database."""
+
+    type = TIMESTAMP()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
 
 class Repository(Base):
     """Repository table."""
@@ -30,14 +54,14 @@ class Repository(Base):
     name = Column(String(255), nullable=False)
     full_name = Column(String(511), nullable=False)
     installation_id = Column(BigInteger, nullable=True)
-    config = Column(JSON, default={})
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
-    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
+    config = Column(JSONDocument, default={})
+    created_at = Column(TIMESTAMP, server_default=utcnow())
+    updated_at = Column(TIMESTAMP, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    pull_requests = relationship("PullRequest", back_populates="repository")
-    code_symbols = relationship("CodeSymbolDB", back_populates="repository")
-    webhook_events = relationship("WebhookEventDB", back_populates="repository")
+    pull_requests = relationship(lambda: PullRequest, back_populates="repository")
+    code_symbols = relationship(lambda: CodeSymbolDB, back_populates="repository")
+    webhook_events = relationship(lambda: WebhookEventDB, back_populates="repository")
 
     __table_args__ = (Index("idx_platform_fullname", "platform", "full_name", unique=True),)
 
@@ -56,12 +80,12 @@ class PullRequest(Base):
     base_branch = Column(String(255))
     author = Column(String(255))
     status = Column(String(50), default="open")
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
-    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=utcnow())
+    updated_at = Column(TIMESTAMP, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    repository = relationship("Repository", back_populates="pull_requests")
-    validation_workflows = relationship("ValidationWorkflowDB", back_populates="pull_request")
+    repository = relationship(Repository, back_populates="pull_requests")
+    validation_workflows = relationship(lambda: ValidationWorkflowDB, back_populates="pull_request")
 
     __table_args__ = (Index("idx_repo_pr_number", "repository_id", "pr_number", unique=True),)
 
@@ -79,13 +103,15 @@ class ValidationWorkflowDB(Base):
     failed_snippets = Column(Integer, default=0)
     corrected_snippets = Column(Integer, default=0)
     execution_time_ms = Column(Integer)
-    started_at = Column(TIMESTAMP, default=datetime.utcnow)
+    started_at = Column(TIMESTAMP, server_default=utcnow())
     completed_at = Column(TIMESTAMP, nullable=True)
     error_message = Column(Text, nullable=True)
 
     # Relationships
-    pull_request = relationship("PullRequest", back_populates="validation_workflows")
-    code_snippets = relationship("CodeSnippetDB", back_populates="workflow")
+    pull_request = relationship(PullRequest, back_populates="validation_workflows")
+    code_snippets = relationship(lambda: CodeSnippetDB, back_populates="workflow")
+
+    __table_args__ = (Index("idx_workflow_pr_status", "pull_request_id", "status"),)
 
 
 class CodeSnippetDB(Base):
@@ -105,14 +131,16 @@ class CodeSnippetDB(Base):
     execution_output = Column(Text, nullable=True)
     error_message = Column(Text, nullable=True)
     execution_time_ms = Column(Integer)
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=utcnow())
 
     # Relationships
-    workflow = relationship("ValidationWorkflowDB", back_populates="code_snippets")
+    workflow = relationship(ValidationWorkflowDB, back_populates="code_snippets")
     documentation_references = relationship(
-        "DocumentationReferenceDB", back_populates="snippet"
+        lambda: DocumentationReferenceDB, back_populates="snippet"
     )
 
+    __table_args__ = (Index("idx_snippet_workflow_status", "workflow_id", "validation_status"),)
+
 
 class CodeSymbolDB(Base):
     """Code symbol table."""
@@ -127,12 +155,12 @@ class CodeSymbolDB(Base):
     file_path = Column(String(1000), nullable=False)
     line_number = Column(Integer)
     commit_sha = Column(String(40))
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=utcnow())
 
     # Relationships
-    repository = relationship("Repository", back_populates="code_symbols")
+    repository = relationship(Repository, back_populates="code_symbols")
     documentation_references = relationship(
-        "DocumentationReferenceDB", back_populates="symbol"
+        lambda: DocumentationReferenceDB, back_populates="symbol"
     )
 
     __table_args__ = (Index("idx_repo_name_type", "repository_id", "name", "type"),)
@@ -148,11 +176,11 @@ class DocumentationReferenceDB(Base):
     symbol_id = Column(Integer, ForeignKey("code_symbols.id"), nullable=False)
     confidence = Column(Numeric(3, 2), default=0.0)
     reference_type = Column(String(50))
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=utcnow())
 
     # Relationships
-    snippet = relationship("CodeSnippetDB", back_populates="documentation_references")
-    symbol = relationship("CodeSymbolDB", back_populates="documentation_references")
+    snippet = relationship(CodeSnippetDB, back_populates="documentation_references")
+    symbol = relationship(CodeSymbolDB, back_populates="documentation_references")
 
 
 class WebhookEventDB(Base):
@@ -164,16 +192,29 @@ class WebhookEventDB(Base):
     repository_id = Column(Integer, ForeignKey("repositories.id"), nullable=False)
     event_type = Column(String(100), nullable=False)
     event_id = Column(String(255))
-    payload = Column(JSON, nullable=False)
+    payload = Column(JSONDocument, nullable=False)
     processed_at = Column(TIMESTAMP, nullable=True)
     status = Column(String(50), default="pending")
     error_message = Column(Text, nullable=True)
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=utcnow())
 
     # Relationships
-    repository = relationship("Repository", back_populates="webhook_events")
+    repository = relationship(Repository, back_populates="webhook_events")
 
-    __table_args__ = (Index("idx_repo_event_id", "repository_id", "event_id", unique=True),)
+    __table_args__ = (
+        Index("idx_repo_event_id", "repository_id", "event_id", unique=True),
+        # Only pending rows are polled; completed events stay out of the index
+        Index(
+            "idx_webhook_pending",
+            "status",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+        Index("idx_webhook_payload_gin", "payload", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
 
 class ValidationMetricsDB(Base):
@@ -191,7 +232,7 @@ class ValidationMetricsDB(Base):
     corrected_snippets = Column(Integer, nullable=False)
     average_execution_time_ms = Column(Integer)
     total_execution_time_ms = Column(Integer)
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=utcnow())
 
     __table_args__ = (
         Index("idx_repo_created", "repository_id", "created_at"),
@@ -213,7 +254,7 @@ class CorrectionMetricsDB(Base):
     validated = Column(Boolean, default=False)
     manual_review_required = Column(Boolean, default=False)
     accepted = Column(Boolean, nullable=True)
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=utcnow())
 
     __table_args__ = (
         Index("idx_repo_created_corr", "repository_id", "created_at"),
@@ -233,6 +274,10 @@ class SystemMetricsDB(Base):
     database_connections = Column(Integer)
     api_rate_limit_remaining = Column(Integer)
     average_webhook_latency_ms = Column(Integer)
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    created_at = Column(TIMESTAMP, server_default=utcnow())
 
     __table_args__ = (Index("idx_sys_created", "created_at"),)
+
+
+# Resolve relationships once at import rather than on the first query
+configure_mappers()
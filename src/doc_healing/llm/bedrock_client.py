@@ -1,22 +1,81 @@
-import json
+import hashlib
 import logging
 import re
+from functools import lru_cache
 from typing import Optional
-import boto3
 from botocore.exceptions import ClientError
+from doc_healing.cache import ResultCache
 from doc_healing.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# A response that is entirely one fenced block, e.g. ```python\n...```
+_CODE_FENCE_RE = re.compile(r'^```\w*\s*\n(.*?)```\s*$', re.DOTALL)
+
+# Static parts of every Converse request, built once instead of per call
+_INFERENCE_CONFIG = {"maxTokens": 4096, "temperature": 0.1}
+
+# Identical snippets recur across PRs; reuse their corrections
+CORRECTION_CACHE_SIZE = 256
+CORRECTION_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+
+@lru_cache(maxsize=8)
+def _get_bedrock_client(region_name: str):
+    """Return a bedrock-runtime client for ``region_name``, built once per process."""
+    # boto3 costs ~200 ms to import; only processes that actually heal pay it
+    import boto3
+    from botocore.config import Config
+
+    settings = get_settings()
+    # One pooled connection per worker thread that can be healing at once;
+    # adaptive retries back off client-side under throttling bursts instead
+    # of hammering the endpoint
+    config = Config(
+        max_pool_connections=settings.worker_threads,
+        retries={"mode": "adaptive"},
+    )
+    return boto3.client(service_name='bedrock-runtime', region_name=region_name, config=config)
+
+
+# Marks the end of the static prefix Bedrock may serve from its prompt cache
+_CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+
+@lru_cache(maxsize=32)
+def _system_blocks(system_prompt: str, prompt_caching: bool) -> list:
+    """Return the Converse ``system`` blocks for one of the fixed system prompts.
+
+    The system prompt is the only part that never varies between snippets,
+    so the cache point goes right after it.
+    """
+    if prompt_caching:
+        return [{"text": system_prompt}, _CACHE_POINT]
+    return [{"text": system_prompt}]
+
+
+def _correction_key(prompt: str, system_prompt: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(system_prompt.encode())
+    digest.update(b"\0")
+    digest.update(prompt.encode())
+    return digest.hexdigest()
+
+
+_corrections = ResultCache(
+    "correction", maxsize=CORRECTION_CACHE_SIZE, ttl=CORRECTION_CACHE_TTL_SECONDS
+)
+
 
 class BedrockLLMClient:
     def __init__(self, region_name: str = "ap-south-1"):
         """Initialize the Bedrock client with boto3/IAM credentials."""
         settings = get_settings()
 
-        self.client = boto3.client(service_name='bedrock-runtime', region_name=region_name)
+        self.client = _get_bedrock_client(region_name)
         self.default_model_id = settings.bedrock_model_id
         self.fallback_model_id = settings.bedrock_fallback_model_id
+        self.prompt_caching = settings.bedrock_prompt_caching
 
     def generate_correction(self, prompt: str, system_prompt: str, use_fallback: bool = False) -> Optional[str]:
         """Send a prompt to the configured Bedrock model to get a code correction.
@@ -26,29 +85,44 @@ class BedrockLLMClient:
         Fallback model: Claude 4 Sonnet via APAC cross-region inference.
         """
         model_id = self.fallback_model_id if use_fallback else self.default_model_id
+        cache_key = _correction_key(prompt, system_prompt)
+        if not use_fallback:
+            cached = _corrections.get(cache_key)
+            if cached is not None:
+                logger.info("Reusing cached correction")
+                return cached
 
         try:
             logger.info(f"Invoking Bedrock model: {model_id}")
             response = self.client.converse(
                 modelId=model_id,
-                system=[{"text": system_prompt}],
+                system=_system_blocks(system_prompt, self.prompt_caching),
                 messages=[
                     {
                         "role": "user",
                         "content": [{"text": prompt}],
                     }
                 ],
-                inferenceConfig={
-                    "maxTokens": 4096,
-                    "temperature": 0.1,
-                },
+                inferenceConfig=_INFERENCE_CONFIG,
             )
 
+            if logger.isEnabledFor(logging.DEBUG):
+                usage = response.get("usage", {})
+                logger.debug(
+                    "Bedrock usage: %s input, %s cache-read, %s cache-write tokens",
+                    usage.get("inputTokens"),
+                    usage.get("cacheReadInputTokens"),
+                    usage.get("cacheWriteInputTokens"),
+                )
+
             output_message = response.get("output", {}).get("message", {})
             content_blocks = output_message.get("content", [])
             if content_blocks and len(content_blocks) > 0:
                 raw_text = content_blocks[0].get("text", "")
-                return self._strip_code_fences(raw_text)
+                correction = self._strip_code_fences(raw_text)
+                if correction:
+                    _corrections.set(cache_key, correction)
+                return correction
 
             return None
 
@@ -72,7 +146,7 @@ class BedrockLLMClient:
     def _strip_code_fences(text: str) -> str:
         """Remove markdown code fences from AI response."""
         text = text.strip()
-        match = re.match(r'^```\w*\s*\n(.*?)```\s*$', text, re.DOTALL)
+        match = _CODE_FENCE_RE.match(text)
         if match:
             return match.group(1).strip()
         return text
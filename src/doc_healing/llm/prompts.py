@@ -8,6 +8,12 @@ Rules:
 4. Ensure the output is valid, executable code in the given target language.
 """
 
+def format_error_messages(errors) -> str:
+    """Join analyzer error messages into the single line the prompts expect."""
+    # str.join materializes a generator into a list first; build it directly
+    return "; ".join([error["message"] for error in errors])
+
+
 def build_healing_prompt(original_code: str, error_log: str, language: str) -> str:
     """Build the user prompt for the healing request."""
     return f"""Please analyze and fix/improve the following {language} code snippet.
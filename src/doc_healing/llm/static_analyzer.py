@@ -197,9 +197,10 @@ def generate_fix_with_ai(code: str, language: str, errors: List[Dict]) -> Option
             MULTILANG_FIX_SYSTEM_PROMPT,
             build_c_security_fix_prompt,
             build_multilang_fix_prompt,
+            format_error_messages,
         )
         
-        error_text = "; ".join(e["message"] for e in errors)
+        error_text = format_error_messages(errors)
         lang = language.lower()
         
         # Use specialized C/C++ security prompt when unsafe functions are detected
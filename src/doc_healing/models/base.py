@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RepositoryInfo:
     """Information about a repository."""
 
@@ -15,7 +15,7 @@ class RepositoryInfo:
     installation_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PullRequestInfo:
     """Information about a pull request."""
 
@@ -28,7 +28,7 @@ class PullRequestInfo:
     repository: RepositoryInfo
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommitInfo:
     """Information about a commit."""
 
@@ -38,7 +38,7 @@ class CommitInfo:
     timestamp: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentationFile:
     """Represents a documentation file."""
 
@@ -1,30 +1,49 @@
 """Configuration models."""
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from types import MappingProxyType
+from typing import Optional, Dict, FrozenSet, Mapping, Tuple
 
+# Defaults are built once at import; immutable ones are shared, mutable ones copied
+_DEFAULT_INCLUDE = ("docs/**/*.md", "README.md", "*.mdx")
+_DEFAULT_EXCLUDE = ("docs/archive/**", "__pycache__/**", "venv/**")
+_DEFAULT_CODE_BLOCK_LANGUAGES = frozenset(
+    {"python", "javascript", "typescript", "java", "go", "rust"}
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class DocumentationPaths:
     """Configuration for documentation file paths."""
 
-    include: List[str] = field(default_factory=lambda: ["docs/**/*.md", "README.md", "*.mdx"])
-    exclude: List[str] = field(
-        default_factory=lambda: ["docs/archive/**", "__pycache__/**", "venv/**"]
-    )
+    include: Tuple[str, ...] = _DEFAULT_INCLUDE
+    exclude: Tuple[str, ...] = _DEFAULT_EXCLUDE
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LanguageConfig:
-    """Configuration for a specific language."""
+    """Configuration for a specific language.
+
+    Frozen so the default instances can be shared between repositories.
+    """
 
     enabled: bool = True
     timeout: int = 30
-    dependencies: List[str] = field(default_factory=list)
+    dependencies: Tuple[str, ...] = ()
     custom_setup: Optional[str] = None
 
 
-@dataclass
+_DEFAULT_LANGUAGES: Mapping[str, LanguageConfig] = MappingProxyType({
+    "python": LanguageConfig(timeout=30, dependencies=("requests", "pytest")),
+    "javascript": LanguageConfig(timeout=20, dependencies=("axios",)),
+    "typescript": LanguageConfig(timeout=25),
+    "java": LanguageConfig(timeout=60),
+    "go": LanguageConfig(timeout=45),
+    "rust": LanguageConfig(timeout=90),
+})
+
+
+@dataclass(slots=True)
 class ValidationConfig:
     """Configuration for validation behavior."""
 
@@ -36,7 +55,7 @@ class ValidationConfig:
     max_concurrent_snippets: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationConfig:
     """Configuration for bot notifications."""
 
@@ -46,32 +65,22 @@ class NotificationConfig:
     email_alerts: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SnippetMarkers:
     """Configuration for code snippet markers."""
 
-    code_block_languages: List[str] = field(
-        default_factory=lambda: ["python", "javascript", "typescript", "java", "go", "rust"]
-    )
+    # Only ever membership-tested per code block, and immutable so it can be shared
+    code_block_languages: FrozenSet[str] = _DEFAULT_CODE_BLOCK_LANGUAGES
     ignore_marker: str = "<!-- doc-healing:ignore -->"
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryConfig:
     """Complete repository configuration."""
 
     enabled: bool = True
     documentation_paths: DocumentationPaths = field(default_factory=DocumentationPaths)
-    languages: Dict[str, LanguageConfig] = field(
-        default_factory=lambda: {
-            "python": LanguageConfig(timeout=30, dependencies=["requests", "pytest"]),
-            "javascript": LanguageConfig(timeout=20, dependencies=["axios"]),
-            "typescript": LanguageConfig(timeout=25),
-            "java": LanguageConfig(timeout=60),
-            "go": LanguageConfig(timeout=45),
-            "rust": LanguageConfig(timeout=90),
-        }
-    )
+    languages: Dict[str, LanguageConfig] = field(default_factory=lambda: dict(_DEFAULT_LANGUAGES))
     validation: ValidationConfig = field(default_factory=ValidationConfig)
     notifications: NotificationConfig = field(default_factory=NotificationConfig)
     snippet_markers: SnippetMarkers = field(default_factory=SnippetMarkers)
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from doc_healing.models.validation import CodeSnippet, ExecutionError, CodeContext
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrectionRequest:
     """Request to generate a correction for a broken snippet."""
 
@@ -15,7 +15,7 @@ class CorrectionRequest:
     documentation_context: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrectionResult:
     """Result of generating a correction."""
 
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List
+from typing import Any, Iterable, List, Mapping, NamedTuple, Optional
 
 
 class SymbolType(Enum):
@@ -22,8 +22,7 @@ class Visibility(Enum):
     PROTECTED = "protected"
 
 
-@dataclass
-class CodeSymbol:
+class CodeSymbol(NamedTuple):
     """Represents a code symbol (function, class, etc.)."""
 
     name: str
@@ -33,6 +32,23 @@ class CodeSymbol:
     line: int
     visibility: Visibility
 
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Mapping[str, Any]]) -> List["CodeSymbol"]:
+        """Build symbols from parsed rows, coercing the enum fields from strings."""
+        symbol_type = SymbolType
+        visibility = Visibility
+        return [
+            cls(
+                row["name"],
+                symbol_type(row["type"]),
+                row["signature"],
+                row["file"],
+                row["line"],
+                visibility(row["visibility"]),
+            )
+            for row in rows
+        ]
+
 
 class ChangeType(Enum):
     """Types of symbol changes."""
@@ -43,7 +59,7 @@ class ChangeType(Enum):
     SIGNATURE_CHANGED = "signature_changed"
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolChange:
     """Represents a change to a code symbol."""
 
@@ -61,7 +77,7 @@ class ReferenceType(Enum):
     EXAMPLE = "example"
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentationReference:
     """Represents a reference from documentation to code."""
 
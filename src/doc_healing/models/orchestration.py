@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, NamedTuple
 
 from doc_healing.models.validation import ValidationResult
 from doc_healing.models.healing import CorrectionResult
@@ -18,7 +18,7 @@ class WorkflowStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationWorkflow:
     """Represents a validation workflow for a pull request."""
 
@@ -38,7 +38,7 @@ class StatusCheckStatus(Enum):
     FAILURE = "failure"
 
 
-@dataclass
+@dataclass(slots=True)
 class PRStatusCheck:
     """Represents a PR status check."""
 
@@ -49,15 +49,14 @@ class PRStatusCheck:
     details_url: Optional[str] = None
 
 
-@dataclass
-class FileChange:
+class FileChange(NamedTuple):
     """Represents a file change in a commit."""
 
     path: str
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BotCommit:
     """Represents a commit made by the bot."""
 
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, NamedTuple, Tuple
 
 
 class ErrorType(Enum):
@@ -14,8 +14,7 @@ class ErrorType(Enum):
     DEPENDENCY = "dependency"
 
 
-@dataclass
-class ExecutionError:
+class ExecutionError(NamedTuple):
     """Details about an execution error."""
 
     type: ErrorType
@@ -24,8 +23,7 @@ class ExecutionError:
     stack_trace: Optional[str] = None
 
 
-@dataclass
-class CodeSnippet:
+class CodeSnippet(NamedTuple):
     """Represents a code snippet extracted from documentation."""
 
     id: str
@@ -34,10 +32,11 @@ class CodeSnippet:
     file: str
     line_start: int
     line_end: int
-    dependencies: Optional[List[str]] = None
+    # A tuple keeps the snippet hashable, so it can key sets and dicts directly
+    dependencies: Optional[Tuple[str, ...]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating a code snippet."""
 
@@ -48,7 +47,7 @@ class ValidationResult:
     execution_time: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeContext:
     """Context information for code execution."""
 
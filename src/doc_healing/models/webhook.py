@@ -6,7 +6,7 @@ from typing import List, Literal
 from doc_healing.models.base import RepositoryInfo, PullRequestInfo, CommitInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookEvent:
     """Represents a webhook event from GitHub or GitLab."""
 
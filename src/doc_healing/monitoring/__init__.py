@@ -1 +1,8 @@
 """Monitoring package for Doc Healing Engine."""
+
+from doc_healing.monitoring.memory import get_memory_usage, log_memory_usage
+
+__all__ = [
+    "get_memory_usage",
+    "log_memory_usage",
+]
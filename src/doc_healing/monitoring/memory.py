@@ -12,28 +12,47 @@ from typing import Dict, Union
 
 logger = logging.getLogger(__name__)
 
-def get_memory_usage() -> Dict[str, Union[int, float]]:
+# One handle per process; forked workers get their own via _process()
+_PROC = psutil.Process(os.getpid())
+
+# Installed memory does not change while we run, so read it once
+_TOTAL_MEMORY = psutil.virtual_memory().total
+
+def _process() -> psutil.Process:
+    """Return the psutil handle for the current process."""
+    global _PROC
+    if _PROC.pid != os.getpid():
+        _PROC = psutil.Process(os.getpid())
+    return _PROC
+
+def get_memory_usage(include_system: bool = True) -> Dict[str, Union[int, float]]:
     """Get current memory usage statistics.
     
+    Args:
+        include_system: Also sample system-wide memory. When False only the
+            process figures are read, which skips a /proc/meminfo parse.
+    
     Returns:
         Dictionary containing memory metrics:
         - rss: Resident Set Size (bytes)
         - vms: Virtual Memory Size (bytes)
         - percent: Percentage of total memory used
-        - available_system: Available system memory (bytes)
-        - total_system: Total system memory (bytes)
+        - available_system: Available system memory (bytes, include_system only)
+        - total_system: Total system memory (bytes, include_system only)
     """
-    process = psutil.Process(os.getpid())
-    mem_info = process.memory_info()
-    sys_mem = psutil.virtual_memory()
+    mem_info = _process().memory_info()
     
-    return {
+    # Same figure as Process.memory_percent(), without its virtual_memory() read
+    metrics = {
         "rss": mem_info.rss,
         "vms": mem_info.vms,
-        "percent": process.memory_percent(),
-        "available_system": sys_mem.available,
-        "total_system": sys_mem.total
+        "percent": mem_info.rss / _TOTAL_MEMORY * 100,
     }
+    if include_system:
+        sys_mem = psutil.virtual_memory()
+        metrics["available_system"] = sys_mem.available
+        metrics["total_system"] = sys_mem.total
+    return metrics
 
 def log_memory_usage(context: str = "general") -> None:
     """Log current memory usage with context.
@@ -41,7 +60,11 @@ def log_memory_usage(context: str = "general") -> None:
     Args:
         context: String identifying where/why memory is being logged
     """
-    metrics = get_memory_usage()
+    # Skip the psutil reads entirely when nothing would be logged
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    metrics = get_memory_usage(include_system=False)
     
     # Convert bytes to MB for readable logging
     rss_mb = metrics["rss"] / (1024 * 1024)
@@ -49,7 +72,6 @@ def log_memory_usage(context: str = "general") -> None:
     percent = round(metrics["percent"], 2)
     
     logger.info(
-        f"Memory Usage [{context}]: "
-        f"RSS={rss_mb:.1f}MB, VMS={vms_mb:.1f}MB, "
-        f"Process Percent={percent}%"
+        "Memory Usage [%s]: RSS=%.1fMB, VMS=%.1fMB, Process Percent=%s%%",
+        context, rss_mb, vms_mb, percent,
     )
@@ -3,6 +3,7 @@
 from doc_healing.queue.redis_client import get_redis_client, redis_client
 from doc_healing.queue.queue_manager import QueueManager, get_queue_manager
 from doc_healing.queue.base import QueueBackend, Task
+from doc_healing.queue.factory import get_queue_backend, reset_queue_backend
 
 __all__ = [
     "get_redis_client",
@@ -11,4 +12,6 @@ __all__ = [
     "get_queue_manager",
     "QueueBackend",
     "Task",
+    "get_queue_backend",
+    "reset_queue_backend",
 ]
@@ -5,12 +5,14 @@ to work with different queue implementations (Redis, in-memory) through a unifie
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, NamedTuple, Tuple
 
 
-@dataclass
-class Task:
+# Queues the application enqueues onto
+QUEUE_NAMES = ("webhooks", "validation", "healing")
+
+
+class Task(NamedTuple):
     """Represents a task in the queue system.
     
     Attributes:
@@ -54,6 +56,41 @@ class QueueBackend(ABC):
         """
         pass
     
+    @abstractmethod
+    def enqueue_unique(
+        self, queue_name: str, dedupe_key: str, func: Callable, *args, **kwargs
+    ) -> Optional[Task]:
+        """Enqueue a task unless one with the same dedupe key is already pending.
+        
+        Args:
+            queue_name: Name of the queue to add the task to
+            dedupe_key: Identifies duplicate work, e.g. a file and snippet ID
+            func: The function to execute
+            *args: Positional arguments to pass to the function
+            **kwargs: Keyword arguments to pass to the function
+            
+        Returns:
+            Optional[Task]: The created task, or None if it was a duplicate
+        """
+        pass
+    
+    def enqueue_many(
+        self, queue_name: str, jobs: List[Tuple[Callable, tuple, dict]]
+    ) -> List[Task]:
+        """Enqueue several tasks on the same queue.
+        
+        The default implementation calls enqueue() once per job; backends
+        override it when they can submit a batch more cheaply.
+        
+        Args:
+            queue_name: Name of the queue to add the tasks to
+            jobs: (func, args, kwargs) triples, in submission order
+            
+        Returns:
+            List[Task]: The created tasks, in the same order as jobs
+        """
+        return [self.enqueue(queue_name, func, *args, **kwargs) for func, args, kwargs in jobs]
+    
     @abstractmethod
     def get_task(self, queue_name: str, timeout: Optional[int] = None) -> Optional[Task]:
         """Get the next task from a queue.
@@ -72,6 +109,35 @@ class QueueBackend(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_queue_length(self, queue_name: str) -> int:
+        """Get the number of tasks waiting in a queue.
+        
+        Args:
+            queue_name: Name of the queue to measure
+            
+        Returns:
+            int: Number of tasks in the queue
+            
+        Raises:
+            QueueError: If there's an error accessing the queue
+        """
+        pass
+    
+    def get_queue_lengths(self, queue_names: Iterable[str]) -> Dict[str, int]:
+        """Get the number of tasks waiting in several queues.
+        
+        The default implementation calls get_queue_length() once per queue;
+        backends override it when they can measure all queues at once.
+        
+        Args:
+            queue_names: Names of the queues to measure
+            
+        Returns:
+            Dict[str, int]: Queue name to number of tasks in that queue
+        """
+        return {name: self.get_queue_length(name) for name in queue_names}
+    
     @abstractmethod
     def mark_complete(self, task: Task) -> None:
         """Mark a task as successfully completed.
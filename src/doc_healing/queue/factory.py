@@ -6,6 +6,7 @@ ensure consistent queue backend usage throughout the application lifecycle.
 """
 
 import logging
+import threading
 from typing import Optional
 
 from doc_healing.config import QueueBackend as QueueBackendEnum
@@ -14,8 +15,9 @@ from doc_healing.queue.base import QueueBackend
 
 logger = logging.getLogger(__name__)
 
-# Global singleton instance
+# Global singleton instance; the lock is only taken while it is being built
 _queue_backend: Optional[QueueBackend] = None
+_queue_backend_lock = threading.Lock()
 
 
 def get_queue_backend() -> QueueBackend:
@@ -40,28 +42,36 @@ def get_queue_backend() -> QueueBackend:
     Note:
         The backend selection is based on the DOC_HEALING_QUEUE_BACKEND
         environment variable. In lightweight mode, this is typically set to
-        'memory' for reduced resource usage.
+        'memory' for reduced resource usage. The memory backend is the
+        in-process path: callables run on a local thread pool with no
+        serialization or network round trip, so tests and single-node
+        deployments should use it rather than a local Redis.
     """
     global _queue_backend
     
-    if _queue_backend is None:
-        settings = get_settings()
-        
-        if settings.queue_backend == QueueBackendEnum.REDIS:
-            # Lazy import to avoid Windows fork context issues
-            from doc_healing.queue.redis_backend import RedisQueueBackend
-            logger.info("Initializing Redis queue backend")
-            _queue_backend = RedisQueueBackend()
-        else:  # QueueBackendEnum.MEMORY
-            # Lazy import for consistency
-            from doc_healing.queue.memory_backend import MemoryQueueBackend
-            logger.info("Initializing in-memory queue backend")
-            _queue_backend = MemoryQueueBackend()
-        
-        logger.info(
-            f"Queue backend initialized: {settings.queue_backend.value} "
-            f"(deployment_mode={settings.deployment_mode.value})"
-        )
+    # Double-checked so concurrent first calls build exactly one backend
+    if _queue_backend is not None:
+        return _queue_backend
+    
+    with _queue_backend_lock:
+        if _queue_backend is None:
+            settings = get_settings()
+            
+            if settings.queue_backend == QueueBackendEnum.REDIS:
+                # Lazy import to avoid Windows fork context issues
+                from doc_healing.queue.redis_backend import RedisQueueBackend
+                logger.info("Initializing Redis queue backend")
+                _queue_backend = RedisQueueBackend()
+            else:  # QueueBackendEnum.MEMORY
+                # Lazy import for consistency
+                from doc_healing.queue.memory_backend import MemoryQueueBackend
+                logger.info("Initializing in-memory queue backend")
+                _queue_backend = MemoryQueueBackend()
+            
+            logger.info(
+                f"Queue backend initialized: {settings.queue_backend.value} "
+                f"(deployment_mode={settings.deployment_mode.value})"
+            )
     
     return _queue_backend
 
@@ -79,13 +89,15 @@ def reset_queue_backend() -> None:
     """
     global _queue_backend
     
-    if _queue_backend is not None:
+    with _queue_backend_lock:
+        backend, _queue_backend = _queue_backend, None
+    
+    if backend is not None:
         # Lazy import for type checking
         from doc_healing.queue.memory_backend import MemoryQueueBackend
         
         # Gracefully shutdown memory backend if applicable
-        if isinstance(_queue_backend, MemoryQueueBackend):
-            _queue_backend.shutdown()
+        if isinstance(backend, MemoryQueueBackend):
+            backend.shutdown()
         
         logger.info("Queue backend instance reset")
-        _queue_backend = None
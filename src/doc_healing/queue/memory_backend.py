@@ -1,15 +1,18 @@
 """In-memory queue backend implementation.
 
-This module implements the QueueBackend interface using Python's threading.Queue,
+This module implements the QueueBackend interface using a thread pool executor,
 providing a lightweight alternative to Redis for development environments.
 Supports both synchronous (immediate execution) and asynchronous (thread pool) modes.
 """
 
+import itertools
 import logging
-import queue
+import os
 import threading
-import uuid
-from typing import Callable, Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 
 from doc_healing.config import get_settings
 from doc_healing.queue.base import QueueBackend, Task
@@ -18,7 +21,7 @@ logger = logging.getLogger(__name__)
 
 
 class MemoryQueueBackend(QueueBackend):
-    """In-memory queue backend implementation using threading.Queue.
+    """In-memory queue backend implementation using a ThreadPoolExecutor.
     
     This backend provides a lightweight alternative to Redis for development
     environments. It supports two execution modes:
@@ -26,62 +29,72 @@ class MemoryQueueBackend(QueueBackend):
     1. Synchronous mode (sync_processing=True): Tasks execute immediately
        when enqueued, blocking until completion.
     
-    2. Asynchronous mode (sync_processing=False): Tasks are queued and
-       processed by a pool of worker threads.
+    2. Asynchronous mode (sync_processing=False): Tasks from every queue
+       are submitted to one ThreadPoolExecutor; the queue name travels on
+       each Task. The executor spawns threads as work arrives, so an idle
+       backend holds no worker threads until its first enqueue.
     
     Note: Tasks do not persist across application restarts.
     
     Attributes:
-        queues: Dictionary mapping queue names to Queue instances
-        tasks: Dictionary mapping task IDs to Task objects
-        lock: Thread lock for synchronizing access to shared state
-        workers: List of worker threads (async mode only)
+        tasks: Dictionary mapping task IDs to Task objects; single-key
+            inserts, lookups and pops are atomic, so no lock is needed
+        workers: Worker threads the pool has started so far (async mode only)
         running: Flag indicating if workers are running
     """
     
     def __init__(self):
         """Initialize in-memory queue backend with configuration from settings."""
-        self.queues: Dict[str, queue.Queue] = {}
         self.tasks: Dict[str, Task] = {}
-        self.lock = threading.Lock()
-        self.workers = []
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._counter = itertools.count()
+        # Dedupe key <-> ID of its pending task; entries go when the task ends
+        self._unique: Dict[str, str] = {}
+        self._unique_keys: Dict[str, str] = {}
+        self._unique_lock = threading.Lock()
+        # Pool threads, recorded by each one as it starts
+        self._workers: List[threading.Thread] = []
+        self._workers_lock = threading.Lock()
         self.running = False
         
         settings = get_settings()
         self.sync_processing = settings.sync_processing
         self.worker_threads = settings.worker_threads
         
-        # Start worker threads if not in sync mode
+        # Start the worker pool if not in sync mode
         if not self.sync_processing:
-            self._start_workers()
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.worker_threads,
+                thread_name_prefix="MemoryQueueWorker",
+                initializer=self._register_worker,
+            )
+            self.running = True
             logger.info(
                 f"Initialized memory queue backend with {self.worker_threads} worker threads"
             )
         else:
             logger.info("Initialized memory queue backend in synchronous mode")
     
-    def _get_queue(self, queue_name: str) -> queue.Queue:
-        """Get or create a Queue instance for the given queue name.
-        
-        Args:
-            queue_name: Name of the queue
-            
-        Returns:
-            queue.Queue: Queue instance
-        """
-        if queue_name not in self.queues:
-            with self.lock:
-                # Double-check after acquiring lock
-                if queue_name not in self.queues:
-                    self.queues[queue_name] = queue.Queue()
-                    logger.debug(f"Created in-memory queue: {queue_name}")
-        return self.queues[queue_name]
+    def _new_task_id(self) -> str:
+        """Return a process-unique task ID: a hex counter plus a random suffix."""
+        return f"{next(self._counter):x}{os.urandom(4).hex()}"
+    
+    @property
+    def workers(self) -> List[threading.Thread]:
+        """Worker threads started so far; the pool starts them on demand."""
+        with self._workers_lock:
+            return list(self._workers)
+    
+    def _register_worker(self) -> None:
+        """Record the calling pool thread; runs once as each thread starts."""
+        with self._workers_lock:
+            self._workers.append(threading.current_thread())
     
     def enqueue(self, queue_name: str, func: Callable, *args, **kwargs) -> Task:
         """Enqueue a task for processing.
         
         In synchronous mode, the task executes immediately before returning.
-        In asynchronous mode, the task is queued for worker thread processing.
+        In asynchronous mode, the task is submitted to the worker pool.
         
         Args:
             queue_name: Name of the queue to add the task to
@@ -96,7 +109,7 @@ class MemoryQueueBackend(QueueBackend):
             Exception: If task execution fails in synchronous mode
         """
         task = Task(
-            id=str(uuid.uuid4()),
+            id=self._new_task_id(),
             func_name=func.__name__,
             args=args,
             kwargs=kwargs,
@@ -121,46 +134,125 @@ class MemoryQueueBackend(QueueBackend):
                 )
                 raise
         else:
-            # Queue for async processing
-            q = self._get_queue(queue_name)
-            with self.lock:
-                self.tasks[task.id] = task
-            q.put((func, args, kwargs, task))
+            # Hand off to the worker pool
+            self.tasks[task.id] = task
+            self._pool.submit(self._run, partial(func, *args, **kwargs), task)
             logger.info(
                 f"Enqueued task {task.id} ({task.func_name}) to queue '{queue_name}'"
             )
         
         return task
     
+    def enqueue_unique(
+        self, queue_name: str, dedupe_key: str, func: Callable, *args, **kwargs
+    ) -> Optional[Task]:
+        """Enqueue a task unless one with the same dedupe key is unfinished.
+        
+        Args:
+            queue_name: Name of the queue to add the task to
+            dedupe_key: Identifies duplicate work, e.g. a file and snippet ID
+            func: The function to execute
+            *args: Positional arguments to pass to the function
+            **kwargs: Keyword arguments to pass to the function
+            
+        Returns:
+            Optional[Task]: The created task, or None if it was a duplicate
+        """
+        if self.sync_processing:
+            # Sync tasks finish before enqueue returns, so nothing can be pending
+            return self.enqueue(queue_name, func, *args, **kwargs)
+        
+        with self._unique_lock:
+            if self._unique.get(dedupe_key) in self.tasks:
+                logger.info(f"Skipped duplicate task for '{dedupe_key}' on queue '{queue_name}'")
+                return None
+            task = self.enqueue(queue_name, func, *args, **kwargs)
+            self._unique[dedupe_key] = task.id
+            self._unique_keys[task.id] = dedupe_key
+        return task
+    
+    def _release_unique(self, task: Task) -> None:
+        """Drop the dedupe entry of a finished task, if it had one."""
+        # Locked: the task may finish before enqueue_unique has recorded it
+        with self._unique_lock:
+            dedupe_key = self._unique_keys.pop(task.id, None)
+            if dedupe_key is not None:
+                del self._unique[dedupe_key]
+    
+    def enqueue_many(
+        self, queue_name: str, jobs: List[Tuple[Callable, tuple, dict]]
+    ) -> List[Task]:
+        """Enqueue several tasks on the same queue.
+        
+        In synchronous mode each job runs in turn, as with enqueue(). In
+        asynchronous mode all tasks are registered with one dict update
+        before any is submitted to the worker pool.
+        
+        Args:
+            queue_name: Name of the queue to add the tasks to
+            jobs: (func, args, kwargs) triples, in submission order
+            
+        Returns:
+            List[Task]: The created tasks, in the same order as jobs
+        """
+        if self.sync_processing:
+            return super().enqueue_many(queue_name, jobs)
+        
+        tasks = [
+            Task(
+                id=self._new_task_id(),
+                func_name=func.__name__,
+                args=args,
+                kwargs=kwargs,
+                queue_name=queue_name,
+            )
+            for func, args, kwargs in jobs
+        ]
+        self.tasks.update((task.id, task) for task in tasks)
+        for (func, args, kwargs), task in zip(jobs, tasks):
+            self._pool.submit(self._run, partial(func, *args, **kwargs), task)
+        
+        logger.info(f"Enqueued {len(tasks)} tasks to queue '{queue_name}'")
+        return tasks
+    
     def get_task(self, queue_name: str, timeout: Optional[int] = None) -> Optional[Task]:
-        """Get the next task from a queue.
+        """Get the oldest unfinished task from a queue.
         
-        This method retrieves a task without executing it. Primarily used
-        for monitoring and inspection.
+        This method inspects a task without executing or removing it, and
+        includes tasks a worker has already picked up. Used for monitoring
+        and inspection.
         
         Args:
-            queue_name: Name of the queue to retrieve from
+            queue_name: Name of the queue to inspect
             timeout: Maximum time to wait for a task (in seconds).
                     None means wait indefinitely, 0 means non-blocking.
                     
         Returns:
-            Optional[Task]: The next task, or None if no task is available
+            Optional[Task]: The oldest unfinished task, or None if there is none
         """
-        q = self._get_queue(queue_name)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Dicts keep insertion order, so the first match is the oldest
+            for task in list(self.tasks.values()):
+                if task.queue_name == queue_name:
+                    return task
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            # Inspection is rare; a short poll keeps enqueue lock-free
+            time.sleep(0.01)
+    
+    def get_queue_length(self, queue_name: str) -> int:
+        """Get the number of unfinished tasks in a queue.
         
-        try:
-            if timeout == 0:
-                # Non-blocking
-                func, args, kwargs, task = q.get_nowait()
-            else:
-                # Blocking with timeout
-                func, args, kwargs, task = q.get(timeout=timeout)
+        Like get_task, this counts tasks a worker has already picked up.
+        
+        Args:
+            queue_name: Name of the queue to measure
             
-            # Put it back for processing
-            q.put((func, args, kwargs, task))
-            return task
-        except queue.Empty:
-            return None
+        Returns:
+            int: Number of unfinished tasks in the queue
+        """
+        return sum(1 for task in list(self.tasks.values()) if task.queue_name == queue_name)
     
     def mark_complete(self, task: Task) -> None:
         """Mark a task as successfully completed.
@@ -168,9 +260,7 @@ class MemoryQueueBackend(QueueBackend):
         Args:
             task: The task to mark as complete
         """
-        with self.lock:
-            if task.id in self.tasks:
-                del self.tasks[task.id]
+        self.tasks.pop(task.id, None)
         logger.debug(f"Task {task.id} ({task.func_name}) marked as complete")
     
     def mark_failed(self, task: Task, error: Exception) -> None:
@@ -180,85 +270,45 @@ class MemoryQueueBackend(QueueBackend):
             task: The task to mark as failed
             error: The exception that caused the failure
         """
-        with self.lock:
-            if task.id in self.tasks:
-                del self.tasks[task.id]
+        self.tasks.pop(task.id, None)
         logger.error(f"Task {task.id} ({task.func_name}) marked as failed: {error}")
     
-    def _start_workers(self):
-        """Start worker threads for asynchronous task processing."""
-        self.running = True
-        for i in range(self.worker_threads):
-            worker = threading.Thread(
-                target=self._worker_loop,
-                name=f"MemoryQueueWorker-{i}",
-                daemon=True
-            )
-            worker.start()
-            self.workers.append(worker)
-            logger.debug(f"Started worker thread: {worker.name}")
-    
-    def _worker_loop(self):
-        """Worker thread main loop for processing tasks from all queues.
+    def _run(self, call: Callable[[], object], task: Task) -> None:
+        """Execute one task on a pool thread and record its outcome.
         
-        This method runs in each worker thread, continuously polling all queues
-        for tasks to process. Uses a round-robin approach with short timeouts
-        to balance load across queues.
+        Args:
+            call: The task function with its arguments already bound
+            task: The task being executed
         """
-        logger.debug(f"Worker thread {threading.current_thread().name} started")
-        
-        while self.running:
-            processed = False
-            
-            # Try to get a task from any queue
-            for queue_name, q in list(self.queues.items()):
-                try:
-                    func, args, kwargs, task = q.get(timeout=0.1)
-                    processed = True
-                    
-                    logger.debug(
-                        f"Worker {threading.current_thread().name} processing "
-                        f"task {task.id} ({task.func_name}) from queue '{queue_name}'"
-                    )
-                    
-                    try:
-                        func(*args, **kwargs)
-                        self.mark_complete(task)
-                        logger.info(
-                            f"Task {task.id} ({task.func_name}) completed successfully"
-                        )
-                    except Exception as e:
-                        self.mark_failed(task, e)
-                        logger.error(
-                            f"Task {task.id} ({task.func_name}) failed: {e}",
-                            exc_info=True
-                        )
-                    
-                    break  # Process one task then check all queues again
-                    
-                except queue.Empty:
-                    continue
-            
-            # If no task was processed, sleep briefly to avoid busy-waiting
-            if not processed:
-                threading.Event().wait(0.1)
+        logger.debug(
+            f"Worker {threading.current_thread().name} processing "
+            f"task {task.id} ({task.func_name}) from queue '{task.queue_name}'"
+        )
         
-        logger.debug(f"Worker thread {threading.current_thread().name} stopped")
+        try:
+            call()
+            self.mark_complete(task)
+            logger.info(
+                f"Task {task.id} ({task.func_name}) completed successfully"
+            )
+        except Exception as e:
+            self.mark_failed(task, e)
+            logger.error("Task %s (%s) failed: %r", task.id, task.func_name, e)
+            # Tracebacks are costly to format; only build them when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Traceback for task {task.id}", exc_info=True)
+        finally:
+            self._release_unique(task)
     
     def shutdown(self):
         """Gracefully shutdown the worker threads.
         
-        This method stops all worker threads and waits for them to complete
-        their current tasks. Should be called during application shutdown.
+        This method stops accepting work, drops tasks that have not started,
+        and waits for running tasks to complete. Should be called during
+        application shutdown.
         """
         if not self.sync_processing:
             logger.info("Shutting down memory queue backend workers")
             self.running = False
-            
-            # Wait for workers to finish
-            for worker in self.workers:
-                worker.join(timeout=5.0)
-                if worker.is_alive():
-                    logger.warning(f"Worker {worker.name} did not stop gracefully")
-            
+            self._pool.shutdown(wait=True, cancel_futures=True)
             logger.info("Memory queue backend shutdown complete")
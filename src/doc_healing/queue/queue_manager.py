@@ -4,9 +4,10 @@ This module provides a high-level interface for enqueueing tasks using the
 queue abstraction layer. It works with both Redis and in-memory queue backends.
 """
 
-from typing import Callable, Optional
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
 
-from doc_healing.queue.base import Task
+from doc_healing.queue.base import QUEUE_NAMES, Task
 from doc_healing.queue.factory import get_queue_backend
 
 
@@ -48,6 +49,17 @@ class QueueManager:
         """
         return self.queue_backend.enqueue("validation", func, *args, **kwargs)
 
+    def enqueue_validation_many(self, jobs: List[Tuple[Callable, tuple, dict]]) -> List[Task]:
+        """Enqueue a batch of validation jobs in one backend call.
+        
+        Args:
+            jobs: (func, args, kwargs) triples, in submission order
+            
+        Returns:
+            Task objects for the enqueued tasks, in the same order as jobs
+        """
+        return self.queue_backend.enqueue_many("validation", jobs)
+
     def enqueue_healing(self, func: Callable, *args, **kwargs) -> Task:
         """Enqueue a healing job.
         
@@ -79,22 +91,27 @@ class QueueManager:
     def get_queue_length(self, queue_name: str) -> int:
         """Get the length of a queue.
         
-        Note: This method is a placeholder. Queue length retrieval is not
-        currently implemented in the queue backend abstraction.
-        
         Args:
             queue_name: Name of the queue
             
         Returns:
-            Number of tasks in the queue (currently always returns 0)
+            Number of tasks waiting in the queue
+        """
+        return self.queue_backend.get_queue_length(queue_name)
+
+    def get_all_queue_lengths(self) -> Dict[str, int]:
+        """Get the length of every queue this manager feeds.
+        
+        Returns:
+            Queue name to number of tasks waiting, for each of QUEUE_NAMES
         """
-        # TODO: Implement queue length in queue backend abstraction
-        return 0
+        return self.queue_backend.get_queue_lengths(QUEUE_NAMES)
 
 
 
 # Global queue manager instance
 _queue_manager: Optional[QueueManager] = None
+_queue_manager_lock = threading.Lock()
 
 
 def get_queue_manager() -> QueueManager:
@@ -105,5 +122,7 @@ def get_queue_manager() -> QueueManager:
     """
     global _queue_manager
     if _queue_manager is None:
-        _queue_manager = QueueManager()
+        with _queue_manager_lock:
+            if _queue_manager is None:
+                _queue_manager = QueueManager()
     return _queue_manager
@@ -5,17 +5,81 @@ wrapping the existing RQ functionality with the new unified queue interface.
 """
 
 import logging
-from typing import Callable, Optional
+import uuid
+import zlib
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from redis import Redis
+from redis.exceptions import RedisError
 from rq import Queue
-from rq.job import Job
+from rq.job import Callback, Job
 
-from doc_healing.config import get_settings
-from doc_healing.queue.base import QueueBackend, Task
+from doc_healing.queue.base import QUEUE_NAMES, QueueBackend, Task
+from doc_healing.queue.redis_client import get_redis_client
+from doc_healing.queue.serializer import OrjsonSerializer
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on jobs buffered in one pipeline before it is flushed
+ENQUEUE_BATCH_SIZE = 10_000
+
+# Upper bound on how long a dedupe claim can outlive its job, e.g. when the
+# worker dies before the job's callbacks run; normally they release it
+DEDUPE_TTL_SECONDS = 600
+
+# Job meta field holding the dedupe claim key the job must release
+_DEDUPE_CLAIM_META = "dedupe_claim"
+
+# Deletes a dedupe claim only while it still names the releasing job; once
+# the claim has expired and another producer re-claimed it, it is theirs.
+_RELEASE_CLAIM_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Reads the head job ID and its payload in one round trip. A job whose hash
+# has expired yields a one-element reply.
+_PEEK_HEAD_SCRIPT = """
+local job_id = redis.call('LINDEX', KEYS[1], 0)
+if not job_id then
+    return false
+end
+return {job_id, redis.call('HGET', ARGV[1] .. job_id, 'data')}
+"""
+
+# Dotted import paths of task functions, resolved once per function
+_FUNC_PATHS: Dict[Callable, str] = {}
+
+
+def _func_ref(func: Callable) -> Union[str, Callable]:
+    """Return the dotted import path RQ stores for ``func``.
+    
+    Handing RQ the string skips its per-job callable inspection. Functions
+    that workers could not import by name (nested or defined in __main__)
+    are passed through unchanged so RQ reports them as usual.
+    """
+    path = _FUNC_PATHS.get(func)
+    if path is None:
+        module = getattr(func, "__module__", None)
+        qualname = getattr(func, "__qualname__", "")
+        if not module or module == "__main__" or "<locals>" in qualname or "." in qualname:
+            return func
+        path = _FUNC_PATHS[func] = f"{module}.{qualname}"
+    return path
+
+
+def _release_claim(connection, claim_key: str, job_id: str) -> None:
+    """Delete ``claim_key`` if ``job_id`` still holds it."""
+    connection.eval(_RELEASE_CLAIM_SCRIPT, 1, claim_key, job_id)
+
+
+def _release_dedupe_claim(job: Job, connection, *outcome) -> None:
+    """RQ success/failure callback: let the same work be enqueued again."""
+    claim_key = job.meta.get(_DEDUPE_CLAIM_META)
+    if claim_key:
+        _release_claim(connection, claim_key, job.id)
+
 
 class RedisQueueBackend(QueueBackend):
     """Redis-based queue backend implementation using RQ.
@@ -25,34 +89,27 @@ class RedisQueueBackend(QueueBackend):
     and survive application restarts.
     
     Attributes:
-        redis_conn: Redis connection instance
+        redis_conn: Redis client shared by every queue in the process
         queues: Dictionary mapping queue names to RQ Queue instances
     """
     
     def __init__(self):
-        """Initialize Redis queue backend with connection from settings."""
-        import os
-        settings = get_settings()
-        redis_password = os.getenv("REDIS_PASSWORD", None)
-        
-        if settings.redis_url:
-            self.redis_conn = Redis.from_url(
-                settings.redis_url,
-                decode_responses=False, # RQ requires bytes mode
-            )
-            logger.info("Initialized Redis queue backend via REDIS_URL")
-        else:
-            self.redis_conn = Redis(
-                host=settings.redis_host,
-                port=settings.redis_port,
-                db=settings.redis_db,
-                password=redis_password,
-                decode_responses=False,  # RQ requires bytes mode
-            )
-            logger.info(
-                f"Initialized Redis queue backend: {settings.redis_host}:{settings.redis_port}"
-            )
+        """Initialize Redis queue backend on the process-wide Redis client."""
+        self.redis_conn = get_redis_client()
+        self._peek_head = self.redis_conn.register_script(_PEEK_HEAD_SCRIPT)
+        # Load the script now so the first peek is one EVALSHA instead of a
+        # NOSCRIPT miss plus SCRIPT LOAD; best effort if Redis is not up yet
+        try:
+            self.redis_conn.script_load(_PEEK_HEAD_SCRIPT)
+        except RedisError as e:
+            logger.debug("Deferred loading the peek script: %s", e)
+        logger.info("Initialized Redis queue backend")
         self.queues: dict[str, Queue] = {}
+        # Queue keys pre-encoded once, so per-call commands skip str.encode
+        self.queue_keys: dict[str, bytes] = {}
+        # The application's queues are known up front; build them now
+        for queue_name in QUEUE_NAMES:
+            self._get_queue(queue_name)
     
     def _get_queue(self, queue_name: str) -> Queue:
         """Get or create an RQ Queue instance for the given queue name.
@@ -63,10 +120,14 @@ class RedisQueueBackend(QueueBackend):
         Returns:
             Queue: RQ Queue instance
         """
-        if queue_name not in self.queues:
-            self.queues[queue_name] = Queue(queue_name, connection=self.redis_conn)
+        queue = self.queues.get(queue_name)
+        if queue is None:
+            self.queues[queue_name] = queue = Queue(
+                queue_name, connection=self.redis_conn, serializer=OrjsonSerializer
+            )
+            self.queue_keys[queue_name] = queue.key.encode()
             logger.debug(f"Created queue: {queue_name}")
-        return self.queues[queue_name]
+        return queue
     
     def enqueue(self, queue_name: str, func: Callable, *args, **kwargs) -> Task:
         """Enqueue a task for processing in Redis.
@@ -84,7 +145,7 @@ class RedisQueueBackend(QueueBackend):
             Exception: If Redis connection fails or enqueue operation fails
         """
         queue = self._get_queue(queue_name)
-        job: Job = queue.enqueue(func, *args, **kwargs)
+        job: Job = queue.enqueue(_func_ref(func), *args, **kwargs)
         
         task = Task(
             id=job.id,
@@ -99,9 +160,111 @@ class RedisQueueBackend(QueueBackend):
         )
         return task
     
+    def enqueue_unique(
+        self, queue_name: str, dedupe_key: str, func: Callable, *args, **kwargs
+    ) -> Optional[Task]:
+        """Enqueue a task unless one with the same dedupe key is still pending.
+        
+        The claim is a single atomic SET NX holding the job's ID, so
+        concurrent producers across processes agree on who enqueues. The job
+        releases it from its success or failure callback, and only while the
+        claim is still its own; the TTL only bounds claims whose worker died
+        before it could.
+        
+        Args:
+            queue_name: Name of the queue to add the task to
+            dedupe_key: Identifies duplicate work, e.g. a file and snippet ID
+            func: The function to execute
+            *args: Positional arguments to pass to the function
+            **kwargs: Keyword arguments to pass to the function
+            
+        Returns:
+            Optional[Task]: The created task, or None if it was a duplicate
+        """
+        claim_key = f"doc_healing:dedupe:{queue_name}:{dedupe_key}"
+        job_id = str(uuid.uuid4())
+        if not self.redis_conn.set(claim_key, job_id, nx=True, ex=DEDUPE_TTL_SECONDS):
+            logger.info(f"Skipped duplicate task for '{dedupe_key}' on queue '{queue_name}'")
+            return None
+        
+        release = Callback(_release_dedupe_claim)
+        try:
+            job: Job = self._get_queue(queue_name).enqueue_call(
+                func=_func_ref(func),
+                args=args,
+                kwargs=kwargs,
+                job_id=job_id,
+                meta={_DEDUPE_CLAIM_META: claim_key},
+                on_success=release,
+                on_failure=release,
+            )
+        except Exception:
+            # Release the claim so a retry is not mistaken for a duplicate
+            _release_claim(self.redis_conn, claim_key, job_id)
+            raise
+        
+        logger.info(f"Enqueued task {job.id} ({func.__name__}) to queue '{queue_name}'")
+        return Task(
+            id=job.id,
+            func_name=func.__name__,
+            args=args,
+            kwargs=kwargs,
+            queue_name=queue_name,
+        )
+    
+    def enqueue_many(
+        self, queue_name: str, jobs: List[Tuple[Callable, tuple, dict]]
+    ) -> List[Task]:
+        """Enqueue several tasks in Redis with one pipelined round trip per batch.
+        
+        Job hashes and queue pushes go through a non-transactional pipeline
+        flushed every ENQUEUE_BATCH_SIZE jobs, so N jobs cost N / batch size
+        round trips instead of several per job.
+        
+        Args:
+            queue_name: Name of the queue to add the tasks to
+            jobs: (func, args, kwargs) triples, in submission order
+            
+        Returns:
+            List[Task]: The created tasks with RQ job IDs, in the same order as jobs
+            
+        Raises:
+            Exception: If Redis connection fails or enqueue operation fails
+        """
+        queue = self._get_queue(queue_name)
+        rq_jobs: List[Job] = []
+        for start in range(0, len(jobs), ENQUEUE_BATCH_SIZE):
+            batch = jobs[start:start + ENQUEUE_BATCH_SIZE]
+            pipe = self.redis_conn.pipeline(transaction=False)
+            rq_jobs.extend(queue.enqueue_many(
+                [
+                    Queue.prepare_data(_func_ref(func), args=args, kwargs=kwargs)
+                    for func, args, kwargs in batch
+                ],
+                pipeline=pipe,
+            ))
+            pipe.execute()
+        
+        tasks = [
+            Task(
+                id=job.id,
+                func_name=func.__name__,
+                args=args,
+                kwargs=kwargs,
+                queue_name=queue_name,
+            )
+            for job, (func, args, kwargs) in zip(rq_jobs, jobs)
+        ]
+        
+        logger.info(f"Enqueued {len(tasks)} tasks to queue '{queue_name}'")
+        return tasks
+    
     def get_task(self, queue_name: str, timeout: Optional[int] = None) -> Optional[Task]:
         """Get the next task from a Redis queue.
         
+        The head job ID and payload are read with one Lua script call,
+        without loading the full RQ job state.
+        
         Note: This method is primarily for monitoring/inspection. RQ workers
         handle task retrieval automatically. For manual task processing,
         use RQ's worker infrastructure.
@@ -113,28 +276,60 @@ class RedisQueueBackend(QueueBackend):
         Returns:
             Optional[Task]: The next task if available, None otherwise
         """
-        queue = self._get_queue(queue_name)
-        job_ids = queue.job_ids
+        self._get_queue(queue_name)
+        head = self._peek_head(
+            keys=[self.queue_keys[queue_name]], args=[Job.redis_job_namespace_prefix]
+        )
         
-        if not job_ids:
+        if not head or len(head) < 2:
             return None
         
-        # Get the first job in the queue
-        job = Job.fetch(job_ids[0], connection=self.redis_conn)
-        
-        # Extract function name from job
-        func_name = job.func_name if hasattr(job, 'func_name') else str(job.func)
+        job_id, raw_data = head
+        # RQ compresses the job payload, but older jobs may be stored raw
+        try:
+            data = zlib.decompress(raw_data)
+        except zlib.error:
+            data = raw_data
+        func_name, _instance, args, kwargs = OrjsonSerializer.loads(data)
         
         task = Task(
-            id=job.id,
+            id=job_id.decode() if isinstance(job_id, bytes) else job_id,
             func_name=func_name,
-            args=job.args or (),
-            kwargs=job.kwargs or {},
+            args=tuple(args or ()),
+            kwargs=kwargs or {},
             queue_name=queue_name,
         )
         
         return task
     
+    def get_queue_length(self, queue_name: str) -> int:
+        """Get the number of jobs waiting in a Redis queue with a single LLEN.
+        
+        Args:
+            queue_name: Name of the queue to measure
+            
+        Returns:
+            int: Number of jobs waiting in the queue
+        """
+        self._get_queue(queue_name)
+        return self.redis_conn.llen(self.queue_keys[queue_name])
+    
+    def get_queue_lengths(self, queue_names: Iterable[str]) -> Dict[str, int]:
+        """Get the number of jobs waiting in several queues in one round trip.
+        
+        Args:
+            queue_names: Names of the queues to measure
+            
+        Returns:
+            Dict[str, int]: Queue name to number of jobs waiting in that queue
+        """
+        names = list(queue_names)
+        pipe = self.redis_conn.pipeline(transaction=False)
+        for name in names:
+            self._get_queue(name)
+            pipe.llen(self.queue_keys[name])
+        return dict(zip(names, pipe.execute()))
+    
     def mark_complete(self, task: Task) -> None:
         """Mark a task as successfully completed.
         
@@ -149,7 +344,7 @@ class RedisQueueBackend(QueueBackend):
             Exception: If the job doesn't exist or status update fails
         """
         try:
-            job = Job.fetch(task.id, connection=self.redis_conn)
+            job = Job.fetch(task.id, connection=self.redis_conn, serializer=OrjsonSerializer)
             # RQ automatically marks jobs as finished when they complete
             # This is mainly for logging/monitoring
             logger.info(f"Task {task.id} ({task.func_name}) marked as complete")
@@ -172,7 +367,7 @@ class RedisQueueBackend(QueueBackend):
             Exception: If the job doesn't exist or status update fails
         """
         try:
-            job = Job.fetch(task.id, connection=self.redis_conn)
+            job = Job.fetch(task.id, connection=self.redis_conn, serializer=OrjsonSerializer)
             # RQ automatically marks jobs as failed when they raise exceptions
             # This is mainly for logging/monitoring
             logger.error(
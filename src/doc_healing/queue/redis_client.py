@@ -1,37 +1,89 @@
 """Redis client configuration."""
 
 import os
-from redis import Redis
+import threading
+from redis import ConnectionPool, Redis
+from redis.connection import UnixDomainSocketConnection
 from typing import Optional
 
-from doc_healing.config import get_settings
+from doc_healing.config import Settings, get_settings
 
-# Global Redis client instance
+# Fail fast when Redis is unreachable and drop dead pooled sockets before reuse
+SOCKET_CONNECT_TIMEOUT = 2
+HEALTH_CHECK_INTERVAL = 30
+
+# Global Redis client instance, shared by RQ queues and the app's own keys
 redis_client: Optional[Redis] = None
 
+# Guards first construction of the global above; steady-state reads skip it
+_client_lock = threading.Lock()
+
+
+def create_connection_pool(
+    settings: Settings,
+    decode_responses: bool = False,
+    long_polling: bool = False,
+) -> ConnectionPool:
+    """Create a sized Redis connection pool from settings.
+
+    ``redis_unix_socket`` wins over ``redis_url``, which wins over host/port,
+    so co-located deployments can bypass the TCP stack entirely.
+
+    Args:
+        settings: Application settings with the Redis location and pool tuning
+        decode_responses: Whether clients on this pool decode replies to str
+        long_polling: Leave ``socket_timeout`` unset for blocking consumers
+            such as RQ workers, which size it above their BLPOP timeout
+
+    Returns:
+        ConnectionPool shared by every client built on it
+    """
+    pool_kwargs = {
+        "max_connections": settings.redis_pool_size,
+        "socket_connect_timeout": SOCKET_CONNECT_TIMEOUT,
+        "health_check_interval": HEALTH_CHECK_INTERVAL,
+        "decode_responses": decode_responses,
+    }
+    if not long_polling:
+        pool_kwargs["socket_timeout"] = settings.redis_socket_timeout
+
+    # Bare REDIS_PASSWORD is still honoured for existing .env files
+    password = settings.redis_password or os.getenv("REDIS_PASSWORD") or None
+
+    if settings.redis_unix_socket:
+        return ConnectionPool(
+            connection_class=UnixDomainSocketConnection,
+            path=settings.redis_unix_socket,
+            db=settings.redis_db,
+            password=password,
+            **pool_kwargs,
+        )
+
+    # TCP_NODELAY is always set by redis-py; keepalive detects half-open sockets
+    pool_kwargs["socket_keepalive"] = True
+
+    if settings.redis_url:
+        return ConnectionPool.from_url(settings.redis_url, **pool_kwargs)
+
+    return ConnectionPool(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        password=password,
+        **pool_kwargs,
+    )
+
 
 def get_redis_client() -> Redis:
-    """Get or create Redis client instance."""
+    """Get or create Redis client instance.
+
+    Replies are raw bytes, as RQ requires, so one pool serves every queue
+    and cache in the process; callers that want str decode at the boundary.
+    """
     global redis_client
     if redis_client is None:
-        settings = get_settings()
-        # Redis connection settings via central config
-        redis_host = settings.redis_host
-        redis_port = settings.redis_port
-        redis_db = settings.redis_db
-        redis_password = os.getenv("REDIS_PASSWORD", None) # Fallback if setting not defined
-
-        if settings.redis_url:
-            redis_client = Redis.from_url(
-                settings.redis_url,
-                decode_responses=True,
-            )
-        else:
-            redis_client = Redis(
-                host=redis_host,
-                port=redis_port,
-                db=redis_db,
-                password=redis_password,
-                decode_responses=True,
-            )
+        with _client_lock:
+            if redis_client is None:
+                # Redis connection settings via central config
+                redis_client = Redis(connection_pool=create_connection_pool(get_settings()))
     return redis_client
@@ -0,0 +1,22 @@
+"""RQ job serializer backed by orjson.
+
+RQ pickles job arguments and results by default. Task payloads here are plain
+strings, lists and dicts, so JSON via orjson is both faster to encode and
+smaller in Redis. Producers and workers must agree on the serializer: pass
+``OrjsonSerializer`` to every ``Queue``/``Worker`` and start CLI workers with
+``rq worker -S doc_healing.queue.serializer.OrjsonSerializer``.
+"""
+
+import orjson
+
+
+class OrjsonSerializer:
+    """RQ serializer that encodes job data as JSON with orjson.
+
+    The orjson functions are bound directly, so each call goes straight to C
+    with no Python wrapper frame; RQ only ever passes the single payload.
+    Tuples come back as lists, which is fine for ``*args`` unpacking.
+    """
+
+    dumps = staticmethod(orjson.dumps)
+    loads = staticmethod(orjson.loads)
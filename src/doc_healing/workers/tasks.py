@@ -7,13 +7,21 @@ with both Redis and in-memory queue backends.
 
 import logging
 import base64
-from typing import Any, Dict, Optional
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import orjson
+
+from doc_healing.config import QueueBackend, get_settings
 from doc_healing.queue.factory import get_queue_backend
+from doc_healing.cache import ResultCache
 from doc_healing.llm.bedrock_client import BedrockLLMClient
 from doc_healing.llm.prompts import (
     build_healing_prompt, HEALING_SYSTEM_PROMPT,
     MULTILANG_FIX_SYSTEM_PROMPT, build_retry_fix_prompt,
+    format_error_messages,
 )
 from doc_healing.llm.static_analyzer import (
     analyze_python_code, analyze_code, detect_language,
@@ -23,25 +31,93 @@ from doc_healing.llm.sandbox import execute_code
 
 logger = logging.getLogger(__name__)
 
+# PR actions that carry new code worth analyzing; everything else is a no-op
+_GITHUB_PR_ACTIONS = frozenset({"opened", "synchronize", "reopened"})
+_GITLAB_CODE_EVENTS = frozenset({"push", "merge_request"})
+_DOC_SUFFIXES = (".md", ".rst", ".txt")
+
+# Triple-backtick code blocks: ```language\n<code>\n```. Compiled once so
+# every file is extracted in a single scan over its content.
+_FENCED_BLOCK_RE = re.compile(r"```(\w+)?\n(.*?)\n```", re.DOTALL)
+
+# Whole healing results, so a snippet re-run unchanged in CI skips the
+# sandbox, the analyzers and Bedrock; shared through Redis when available
+HEAL_RESULT_CACHE_SIZE = 256
+HEAL_RESULT_TTL_SECONDS = 3600
+_heal_results = ResultCache("heal", maxsize=HEAL_RESULT_CACHE_SIZE, ttl=HEAL_RESULT_TTL_SECONDS)
+
+# Validation outcomes by language and code; the same example snippet is
+# often vendored into many files and re-validated on every CI run
+VALIDATION_CACHE_SIZE = 4096
+VALIDATION_CACHE_TTL_SECONDS = 3600
+_validation_results = ResultCache(
+    "validation", maxsize=VALIDATION_CACHE_SIZE, ttl=VALIDATION_CACHE_TTL_SECONDS
+)
+
+
+def _content_key(*parts: str) -> str:
+    """Hash everything a cached task result depends on."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _check_snippet(code: str, language: str) -> Dict[str, Any]:
+    """Run static analysis and the sandbox; depends only on code and language."""
+    errors = []
+    warnings = []
+    
+    # Step 1: Static analysis (all languages)
+    analysis = analyze_code(code, language)
+    if analysis["has_issues"]:
+        for e in analysis["errors"]:
+            errors.append(f"{e['type']}: {e['message']}")
+    
+    # Step 2: Sandbox execution (Python only, other languages skip gracefully)
+    sandbox_result = execute_code(code, language)
+    timed_out = False
+    if not sandbox_result.get("skipped"):
+        if not sandbox_result["success"]:
+            err_type = sandbox_result.get("error_type", "RuntimeError")
+            err_msg = sandbox_result.get("error_message", "Unknown execution error")
+            error_str = f"{err_type}: {err_msg}"
+            if error_str not in errors:
+                errors.append(error_str)
+            if sandbox_result.get("timed_out"):
+                timed_out = True
+                warnings.append("Code execution timed out — possible infinite loop")
+    else:
+        warnings.append(f"Sandbox execution not available for {language} — validated with static analysis only")
+    
+    return {
+        "errors": errors,
+        "warnings": warnings,
+        "sandbox_executed": not sandbox_result.get("skipped", True),
+        # Timeouts depend on machine load, so they are not worth replaying
+        "cacheable": not timed_out,
+    }
+
 
 def process_github_webhook(payload: Dict[str, Any]) -> None:
     """Process a GitHub webhook event: analyze PR diffs and post healing comments."""
     logger.info("Processing GitHub webhook")
     
-    import httpx
-    from doc_healing.config import get_settings
-    import re
-    
     if not isinstance(payload, dict):
         raise ValueError("Webhook payload must be a dictionary")
     
+    # Filter on shape before any imports or settings lookups: most deliveries
+    # are events we ignore and should cost no more than two dict reads
     action = payload.get("action")
     pull_request = payload.get("pull_request")
     
-    if action not in ["opened", "synchronize", "reopened"] or not pull_request:
+    if action not in _GITHUB_PR_ACTIONS or not pull_request:
         logger.info("GitHub webhook processed successfully")
         return
     
+    import httpx
+    
     pr_number = pull_request.get("number")
     repo_full_name = payload.get("repository", {}).get("full_name")
     issue_url = pull_request.get("issue_url")
@@ -50,7 +126,7 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
     head_sha = pull_request.get("head", {}).get("sha")
     pr_url = pull_request.get("html_url", "")
     
-    logger.info(f"Processing PR #{pr_number} '{pr_title}' for {repo_full_name}")
+    logger.info("Processing PR #%s '%s' for %s", pr_number, pr_title, repo_full_name)
     
     settings = get_settings()
     headers = {"Accept": "application/vnd.github.v3+json"}
@@ -82,7 +158,7 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
             checks_resp = client.post(checks_url, json=check_run_payload, headers=headers)
             if checks_resp.status_code == 201:
                 check_run_id = checks_resp.json().get("id")
-                logger.info(f"Created GitHub check run {check_run_id}")
+                logger.info("Created GitHub check run %s", check_run_id)
             else:
                 logger.warning(f"Failed to create check run: {checks_resp.status_code} {checks_resp.text}")
         except Exception as e:
@@ -102,7 +178,7 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
             return
         
         changed_files = files_resp.json()
-        logger.info(f"PR #{pr_number} has {len(changed_files)} changed file(s)")
+        logger.info("PR #%s has %s changed file(s)", pr_number, len(changed_files))
         
         # Categorize files
         doc_files = []
@@ -188,7 +264,7 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
                 if not code or code in tagged_code_set:
                     continue
                 detected_lang = detect_language(code)
-                logger.info(f"Auto-detected language '{detected_lang}' for untagged block in {fname}")
+                logger.info("Auto-detected language '%s' for untagged block in %s", detected_lang, fname)
                 all_snippets.append({"file": fname, "lang": detected_lang, "code": code})
             
             # Also scan the diff patch for code-like lines NOT in any fenced block
@@ -217,10 +293,10 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
                     if code_like_lines:
                         raw_code = "\n".join(code_like_lines)
                         detected_lang = detect_language(raw_code)
-                        logger.info(f"Found {len(code_like_lines)} code-like line(s) in diff of {fname}, detected as '{detected_lang}'")
+                        logger.info("Found %s code-like line(s) in diff of %s, detected as '%s'", len(code_like_lines), fname, detected_lang)
                         all_snippets.append({"file": fname, "lang": detected_lang, "code": raw_code, "from_diff": True})
         
-        logger.info(f"Found {len(all_snippets)} code snippet(s) across {len(doc_files)} documentation file(s)")
+        logger.info("Found %s code snippet(s) across %s documentation file(s)", len(all_snippets), len(doc_files))
         
         # Build language statistics for summary
         lang_counts = {}
@@ -243,7 +319,7 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
             lang = snippet["lang"]
             fname = snippet["file"]
             
-            logger.info(f"Analyzing snippet {idx} ({lang}) from {fname}")
+            logger.info("Analyzing snippet %s (%s) from %s", idx, lang, fname)
             
             try:
                 result = heal_code_snippet(
@@ -339,7 +415,7 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
         
         # Step 4.5: Auto-commit all healed snippets
         if fixes_to_commit:
-            logger.info(f"Applying {len(fixes_to_commit)} auto-commit fixes...")
+            logger.info("Applying %s auto-commit fixes...", len(fixes_to_commit))
             for fix in fixes_to_commit:
                 try:
                     # 1. Get current file content and SHA
@@ -360,7 +436,7 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
                         
                         # Only commit if we actually changed something
                         if new_content != current_content:
-                            logger.info(f"Committing fix for {fix['file']}")
+                            logger.info("Committing fix for %s", fix['file'])
                             commit_payload = {
                                 "message": f"🤖 OASIS: Fixed {fix.get('fix_description', 'code issues')} in {fix['file']}",
                                 "content": base64.b64encode(new_content.encode("utf-8")).decode("utf-8"),
@@ -369,7 +445,7 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
                             }
                             commit_resp = client.put(file_url, json=commit_payload, headers=headers)
                             if commit_resp.status_code in (200, 201):
-                                logger.info(f"Successfully committed fix to {fix['file']}")
+                                logger.info("Successfully committed fix to %s", fix['file'])
                                 snippet_results.append(f"✅ **Auto-committed fix** for `{fix['file']}` directly to this branch!")
                             else:
                                 logger.error(f"Failed to commit fix: {commit_resp.text}")
@@ -412,7 +488,7 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
                     lang = l
                     break
             
-            logger.info(f"Analyzing code file {fname} ({lang}, {len(added_lines)} new lines)")
+            logger.info("Analyzing code file %s (%s, %s new lines)", fname, lang, len(added_lines))
             
             try:
                 result = heal_code_snippet(
@@ -471,14 +547,14 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
         if existing_comment_id:
             # PATCH existing comment
             patch_url = f"https://api.github.com/repos/{repo_full_name}/issues/comments/{existing_comment_id}"
-            logger.info(f"Updating existing comment {existing_comment_id}")
+            logger.info("Updating existing comment %s", existing_comment_id)
             post_resp = client.patch(patch_url, json={"body": comment_body}, headers=headers)
         else:
             # POST new comment
-            logger.info(f"Posting new comment to {comments_url}")
+            logger.info("Posting new comment to %s", comments_url)
             post_resp = client.post(comments_url, json={"body": comment_body}, headers=headers)
         
-        logger.info(f"GitHub API response: {post_resp.status_code}")
+        logger.info("GitHub API response: %s", post_resp.status_code)
         
         # Step 6: Update Check Run (Completed)
         if check_run_id:
@@ -499,7 +575,7 @@ def process_github_webhook(payload: Dict[str, Any]) -> None:
                 }
                 checks_url = f"https://api.github.com/repos/{repo_full_name}/check-runs/{check_run_id}"
                 client.patch(checks_url, json=check_run_payload, headers=headers)
-                logger.info(f"Updated GitHub check run {check_run_id} to {conclusion}")
+                logger.info("Updated GitHub check run %s to %s", check_run_id, conclusion)
             except Exception as e:
                 logger.error(f"Error updating check run {check_run_id}: {e}")
     
@@ -521,19 +597,20 @@ def process_gitlab_webhook(payload: Dict[str, Any]) -> None:
     if not event_type:
         logger.warning("Webhook payload missing object_kind")
     
-    logger.info(f"GitLab event: {event_type} for project: {project_name}")
+    logger.info("GitLab event: %s for project: %s", event_type, project_name)
     
-    if event_type in ["push", "merge_request"]:
+    if event_type in _GITLAB_CODE_EVENTS:
         commits = payload.get("commits", [])
         changed_files = []
         for commit in commits[:5]:
-            added = commit.get("added", [])
-            modified = commit.get("modified", [])
-            for fp in added + modified:
-                if fp.endswith((".md", ".rst", ".txt")):
-                    changed_files.append(fp)
+            changed_files.extend(
+                fp for fp in commit.get("added", ()) if fp.endswith(_DOC_SUFFIXES)
+            )
+            changed_files.extend(
+                fp for fp in commit.get("modified", ()) if fp.endswith(_DOC_SUFFIXES)
+            )
         
-        logger.info(f"Found {len(changed_files)} documentation file(s) to validate")
+        logger.info("Found %s documentation file(s) to validate", len(changed_files))
         # File content would be fetched via GitLab API in production
     
     logger.info("GitLab webhook processed successfully")
@@ -566,47 +643,40 @@ def validate_code_snippet(
     Raises:
         ValueError: If required parameters are missing or invalid
     """
-    logger.info(f"Validating code snippet {snippet_id} from {file_path}")
-    logger.debug(f"Language: {language}, Code length: {len(code)} chars")
+    logger.info("Validating code snippet %s from %s", snippet_id, file_path)
+    logger.debug("Language: %s, Code length: %s chars", language, len(code))
     
     # Validate inputs
     if not file_path or not snippet_id or not code or not language:
         raise ValueError("All parameters (file_path, snippet_id, code, language) are required")
     
-    errors = []
-    warnings = []
-    
-    # Step 1: Static analysis (all languages)
-    analysis = analyze_code(code, language)
-    if analysis["has_issues"]:
-        for e in analysis["errors"]:
-            errors.append(f"{e['type']}: {e['message']}")
-    
-    # Step 2: Sandbox execution (Python only, other languages skip gracefully)
-    sandbox_result = execute_code(code, language)
-    if not sandbox_result.get("skipped"):
-        if not sandbox_result["success"]:
-            err_type = sandbox_result.get("error_type", "RuntimeError")
-            err_msg = sandbox_result.get("error_message", "Unknown execution error")
-            error_str = f"{err_type}: {err_msg}"
-            if error_str not in errors:
-                errors.append(error_str)
-            if sandbox_result.get("timed_out"):
-                warnings.append("Code execution timed out — possible infinite loop")
-        else:
-            logger.info(f"Sandbox execution succeeded for {snippet_id}")
+    cache_key = _content_key(language, code)
+    cached = _validation_results.get(cache_key)
+    if cached is not None:
+        logger.info("Reusing cached validation result for %s", snippet_id)
+        checked = orjson.loads(cached)
     else:
-        warnings.append(f"Sandbox execution not available for {language} — validated with static analysis only")
-    
+        checked = _check_snippet(code, language)
+        if checked["sandbox_executed"] and not checked["errors"]:
+            logger.info("Sandbox execution succeeded for %s", snippet_id)
+        if checked["cacheable"]:
+            _validation_results.set(cache_key, orjson.dumps(checked).decode())
+    
+    errors = checked["errors"]
+    warnings = checked["warnings"]
     valid = len(errors) == 0
     
     # Step 3: If validation fails, enqueue healing
     if not valid:
         queue = get_queue_backend()
         try:
-            queue.enqueue("healing", heal_code_snippet,
-                         file_path, snippet_id, code, language, errors)
-            logger.info(f"Enqueued healing task for {snippet_id}")
+            # Concurrent validations of one snippet version should heal it only
+            # once; edited code hashes differently and is healed afresh
+            dedupe_key = f"{file_path}:{snippet_id}:{cache_key}"
+            task = queue.enqueue_unique("healing", dedupe_key, heal_code_snippet,
+                                        file_path, snippet_id, code, language, errors)
+            if task is not None:
+                logger.info("Enqueued healing task for %s", snippet_id)
         except Exception as e:
             logger.warning(f"Could not enqueue healing for {snippet_id}: {e}")
     
@@ -617,37 +687,36 @@ def validate_code_snippet(
         "snippet_id": snippet_id,
         "file_path": file_path,
         "language": language,
-        "sandbox_executed": not sandbox_result.get("skipped", True),
+        "sandbox_executed": checked["sandbox_executed"],
     }
     
-    logger.info(f"Code snippet {snippet_id} validation complete: valid={valid}, errors={len(errors)}")
+    logger.info("Code snippet %s validation complete: valid=%s, errors=%s", snippet_id, valid, len(errors))
     return result
 
 
 def validate_documentation_file(file_path: str, content: str) -> Dict[str, Any]:
     """Validate all code snippets in a documentation file."""
-    import re
-    import hashlib
-    
-    logger.info(f"Validating documentation file: {file_path}")
+    logger.info("Validating documentation file: %s", file_path)
     
     if not file_path or not content:
         raise ValueError("Both file_path and content are required")
     
-    # Extract triple-backtick code blocks: ```language\n<code>\n```
-    pattern = re.compile(r"```(\w+)?\n(.*?)\n```", re.DOTALL)
-    matches = pattern.findall(content)
+    matches = _FENCED_BLOCK_RE.findall(content)
     
-    queue = get_queue_backend()
     snippets_found = len(matches)
+    jobs = []
     
     for i, (lang, code) in enumerate(matches):
         lang = lang.strip() if lang else "unknown"
         content_hash = hashlib.md5(code.encode()).hexdigest()[:8]
         snippet_id = f"snippet-{i}-{content_hash}"
         
-        logger.info(f"Enqueuing validation for {snippet_id} ({lang}) from {file_path}")
-        queue.enqueue("validation", validate_code_snippet, file_path, snippet_id, code, lang)
+        logger.info("Enqueuing validation for %s (%s) from %s", snippet_id, lang, file_path)
+        jobs.append((validate_code_snippet, (file_path, snippet_id, code, lang), {}))
+    
+    # Files without code blocks never touch the queue backend
+    if jobs:
+        get_queue_backend().enqueue_many("validation", jobs)
     
     result = {
         "file_path": file_path,
@@ -655,7 +724,7 @@ def validate_documentation_file(file_path: str, content: str) -> Dict[str, Any]:
         "status": "enqueued",
     }
     
-    logger.info(f"Documentation file {file_path}: {snippets_found} snippets enqueued")
+    logger.info("Documentation file %s: %s snippets enqueued", file_path, snippets_found)
     return result
 
 
@@ -679,14 +748,14 @@ def _validate_and_retry_fix(
         validation = analyze_code(current_fix, language)
         
         if not validation["has_issues"]:
-            logger.info(f"AI fix validated successfully (attempt {attempt})")
+            logger.info("AI fix validated successfully (attempt %s)", attempt)
             return current_fix
         
         # Fix still has issues — retry with error feedback
-        error_feedback = "; ".join(e["message"] for e in validation["errors"])
+        error_feedback = format_error_messages(validation["errors"])
         logger.info(
-            f"AI fix still has {len(validation['errors'])} issue(s) on attempt {attempt}, "
-            f"retrying with feedback: {error_feedback[:100]}"
+            "AI fix still has %s issue(s) on attempt %s, retrying with feedback: %s",
+            len(validation['errors']), attempt, error_feedback[:100],
         )
         
         try:
@@ -734,11 +803,23 @@ def heal_code_snippet(
     2. Static analysis (ast/compile) for reliable bug detection
     3. Amazon Bedrock AI for complex code that needs deeper understanding
     """
-    logger.info(f"Healing code snippet {snippet_id} from {file_path}")
+    logger.info("Healing code snippet %s from %s", snippet_id, file_path)
     
     if not file_path or not snippet_id or not code or not language:
         raise ValueError("All parameters (file_path, snippet_id, code, language) are required")
     
+    # One canonical, order-independent form for both the cache key and the
+    # prompt, rather than the repr of whatever list the caller passed
+    error_log = "\n".join(sorted(map(str, errors))) if errors else ""
+    cache_key = _content_key(language, code, error_log)
+    cached = _heal_results.get(cache_key)
+    if cached is not None:
+        logger.info("Reusing cached healing result for %s", snippet_id)
+        result = orjson.loads(cached)
+        result["snippet_id"] = snippet_id
+        result["file_path"] = file_path
+        return result
+    
     changes = []
     healed_code = None
     confidence = 0.0
@@ -757,16 +838,16 @@ def heal_code_snippet(
             "detail": f"Runtime execution error: {err_msg}",
             "source": "sandbox",
         })
-        logger.info(f"Sandbox caught {err_type} in {snippet_id}: {err_msg}")
+        logger.info("Sandbox caught %s in %s: %s", err_type, snippet_id, err_msg)
     
     # Step 2: Static analysis (works for all languages, no external dependency)
-    logger.info(f"Running static analysis on {snippet_id} (language: {language})")
+    logger.info("Running static analysis on %s (language: %s)", snippet_id, language)
     analysis = analyze_code(code, language)
     
     if analysis["has_issues"]:
         detected_errors = analysis["errors"]
         method_name = analysis.get("analysis_method", "static")
-        logger.info(f"Static analysis ({method_name}) found {len(detected_errors)} issue(s) in {snippet_id}")
+        logger.info("Static analysis (%s) found %s issue(s) in %s", method_name, len(detected_errors), snippet_id)
         
         if analysis.get("fixed_code"):
             healed_code = analysis["fixed_code"]
@@ -782,20 +863,19 @@ def heal_code_snippet(
     # The AI handles: logic errors, complex type mismatches, algorithm bugs,
     # missing edge cases, and cross-language issues that static analysis can't catch.
     use_ai = True  # Always attempt AI — it gracefully fails if unavailable
+    ai_completed = False
     
     if use_ai:
         try:
             # Build rich context for the LLM including all error sources
-            error_context = str(errors) if errors else "No explicit errors provided."
+            error_context = error_log or "No explicit errors provided."
             
             if detected_errors:
-                error_context += "\n\nStatic analysis found: " + "; ".join(
-                    e["message"] for e in detected_errors
-                )
+                error_context += "\n\nStatic analysis found: " + format_error_messages(detected_errors)
             
             if sandbox_errors:
                 error_context += "\n\nRuntime execution errors: " + "; ".join(
-                    f"{e['type']}: {e['message']}" for e in sandbox_errors
+                    [f"{e['type']}: {e['message']}" for e in sandbox_errors]
                 )
             
             # If no errors found by static analysis, ask AI for deeper review
@@ -823,13 +903,15 @@ def heal_code_snippet(
                     healed_code = validated_fix
                     changes.append("Enhanced fix using Amazon Bedrock AI (validated)")
                     confidence = 0.95
-                    logger.info(f"Bedrock AI provided validated fix for {snippet_id}")
+                    logger.info("Bedrock AI provided validated fix for %s", snippet_id)
                 else:
                     # AI fix failed validation — still use it but lower confidence
                     healed_code = ai_code.strip()
                     changes.append("Fix via Amazon Bedrock AI (auto-fix validation failed — review recommended)")
                     confidence = 0.60
                     logger.warning(f"Bedrock AI fix for {snippet_id} could not be validated")
+            # The client answers None when Bedrock errored or throttled
+            ai_completed = bool(ai_code and ai_code.strip())
         except Exception as e:
             logger.warning(f"Bedrock AI unavailable for {snippet_id}: {str(e)[:100]}")
             # Static analysis + sandbox results are still used
@@ -848,23 +930,44 @@ def heal_code_snippet(
         "sandbox_executed": not sandbox_result.get("skipped", True),
     }
     
-    logger.info(f"Code snippet {snippet_id} healing complete: healed={healed}, errors_found={len(detected_errors)}")
+    # A result degraded by an unavailable Bedrock is not worth replaying
+    if ai_completed:
+        _heal_results.set(cache_key, orjson.dumps(result).decode())
+    
+    logger.info("Code snippet %s healing complete: healed=%s, errors_found=%s", snippet_id, healed, len(detected_errors))
     return result
 
 
+def _run_heals_inline(jobs: List[Tuple[Callable, tuple, dict]]) -> None:
+    """Run heal jobs concurrently in this process and wait for all of them.
+    
+    Used when the queue would execute them synchronously one by one anyway;
+    each heal is dominated by its Bedrock call, so overlapping them brings a
+    file's wall time down to roughly its slowest snippet.
+    """
+    # Bounded like the worker pool, which is what the Bedrock client's
+    # connection pool is sized for
+    max_workers = min(len(jobs), get_settings().worker_threads)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="InlineHeal") as pool:
+        futures = [pool.submit(func, *args, **kwargs) for func, args, kwargs in jobs]
+    # Surface the first failure, as a synchronous enqueue would
+    for future in futures:
+        future.result()
+
+
 def heal_documentation_file(
     file_path: str,
     validation_results: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Heal all invalid code snippets in a documentation file."""
-    logger.info(f"Healing documentation file: {file_path}")
+    logger.info("Healing documentation file: %s", file_path)
     
     if not file_path or not validation_results:
         raise ValueError("Both file_path and validation_results are required")
     
-    queue = get_queue_backend()
     snippets_healed = 0
     snippets_failed = 0
+    jobs = []
     
     invalid_snippets = validation_results.get("invalid_snippets", [])
     for snippet in invalid_snippets:
@@ -874,13 +977,21 @@ def heal_documentation_file(
         errors = snippet.get("errors", [])
         
         if code:
-            queue.enqueue("healing", heal_code_snippet,
-                         file_path, snippet_id, code, language, errors)
+            jobs.append((heal_code_snippet, (file_path, snippet_id, code, language, errors), {}))
             snippets_healed += 1
-            logger.info(f"Enqueued healing for {snippet_id}")
+            logger.info("Enqueuing healing for %s", snippet_id)
         else:
             snippets_failed += 1
     
+    if jobs:
+        settings = get_settings()
+        if (settings.sync_processing and settings.queue_backend == QueueBackend.MEMORY
+                and len(jobs) > 1):
+            _run_heals_inline(jobs)
+        else:
+            # One pipelined submission for the whole file instead of a round trip per snippet
+            get_queue_backend().enqueue_many("healing", jobs)
+    
     result = {
         "file_path": file_path,
         "snippets_healed": snippets_healed,
@@ -888,6 +999,6 @@ def heal_documentation_file(
         "pull_request_url": None,
     }
     
-    logger.info(f"Documentation file healing: {snippets_healed} healed, {snippets_failed} failed")
+    logger.info("Documentation file healing: %s healed, %s failed", snippets_healed, snippets_failed)
     return result
 
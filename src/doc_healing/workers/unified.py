@@ -8,10 +8,10 @@ asynchronous processing modes and includes graceful shutdown handling.
 import logging
 import signal
 import sys
-import time
+import threading
 from typing import Optional
 
-from doc_healing.config import get_settings
+from doc_healing.config import Settings, get_settings
 from doc_healing.queue.factory import get_queue_backend
 from doc_healing.queue.memory_backend import MemoryQueueBackend
 
@@ -29,7 +29,7 @@ class UnifiedWorker:
     process simply keeps the application alive.
     
     In asynchronous mode with memory backend, worker threads are managed by
-    MemoryQueueBackend. The worker process monitors and keeps threads alive.
+    MemoryQueueBackend. The worker process keeps them alive until shutdown.
     
     In asynchronous mode with Redis backend, this worker would poll queues
     and process tasks (to be implemented when needed).
@@ -41,12 +41,18 @@ class UnifiedWorker:
         shutdown_requested: Flag indicating if shutdown has been requested
     """
     
-    def __init__(self):
-        """Initialize the unified worker with queue backend and settings."""
+    def __init__(self, settings: Optional[Settings] = None):
+        """Initialize the unified worker with queue backend and settings.
+        
+        Args:
+            settings: Already-loaded settings; read via get_settings() if omitted
+        """
         self.queue_backend = get_queue_backend()
-        self.settings = get_settings()
+        self.settings = settings if settings is not None else get_settings()
         self.running = False
         self.shutdown_requested = False
+        # Set on stop or signal; the run loops park on it instead of polling
+        self._stop_event = threading.Event()
         
         # Register signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -66,7 +72,7 @@ class UnifiedWorker:
           The worker just keeps the process alive.
         
         - Asynchronous mode with memory backend: Worker threads are already
-          started by MemoryQueueBackend. The worker monitors them.
+          started by MemoryQueueBackend. The worker waits for shutdown.
         
         - Asynchronous mode with Redis backend: The worker would poll queues
           and process tasks (to be implemented).
@@ -99,41 +105,31 @@ class UnifiedWorker:
         """
         logger.info("Worker running in synchronous mode")
         
-        while self.running and not self.shutdown_requested:
-            time.sleep(1)
+        self._stop_event.wait()
         
         logger.info("Synchronous mode worker stopped")
     
     def _run_memory_async_mode(self):
         """Run in asynchronous mode with memory backend.
         
-        Worker threads are managed by MemoryQueueBackend. This method monitors
-        the threads and keeps the process alive.
+        Worker threads are managed by MemoryQueueBackend. Its thread pool
+        catches every task exception in the worker itself, so pool threads
+        only exit on shutdown and there is nothing to poll; this method just
+        keeps the process alive.
         """
         logger.info("Worker running in asynchronous mode with memory backend")
         
         # Verify worker threads are running
         if isinstance(self.queue_backend, MemoryQueueBackend):
             if not self.queue_backend.workers:
-                logger.warning("No worker threads found in memory backend")
+                # The backend's thread pool starts threads as tasks arrive
+                logger.info("Memory backend worker threads start on demand")
             else:
                 logger.info(
-                    f"Monitoring {len(self.queue_backend.workers)} worker threads"
+                    f"Running with {len(self.queue_backend.workers)} worker threads"
                 )
         
-        while self.running and not self.shutdown_requested:
-            # Monitor worker threads health
-            if isinstance(self.queue_backend, MemoryQueueBackend):
-                alive_workers = sum(
-                    1 for w in self.queue_backend.workers if w.is_alive()
-                )
-                if alive_workers < len(self.queue_backend.workers):
-                    logger.warning(
-                        f"Only {alive_workers}/{len(self.queue_backend.workers)} "
-                        "worker threads are alive"
-                    )
-            
-            time.sleep(5)  # Check every 5 seconds
+        self._stop_event.wait()
         
         logger.info("Asynchronous mode worker stopped")
     
@@ -150,8 +146,7 @@ class UnifiedWorker:
             "This unified worker is running but not processing tasks."
         )
         
-        while self.running and not self.shutdown_requested:
-            time.sleep(1)
+        self._stop_event.wait()
         
         logger.info("Redis mode worker stopped")
     
@@ -167,6 +162,7 @@ class UnifiedWorker:
         
         logger.info("Stopping unified worker")
         self.running = False
+        self._stop_event.set()
         
         # Shutdown queue backend if it supports it
         if isinstance(self.queue_backend, MemoryQueueBackend):
@@ -185,14 +181,18 @@ class UnifiedWorker:
         signal_name = signal.Signals(signum).name
         logger.info(f"Received {signal_name} signal, initiating graceful shutdown")
         self.shutdown_requested = True
+        self._stop_event.set()
         self.stop()
 
 
-def main():
+def main(settings: Optional[Settings] = None):
     """Main entry point for the unified worker process.
     
     This function creates and starts a UnifiedWorker instance, handling
     keyboard interrupts and other shutdown signals gracefully.
+    
+    Args:
+        settings: Already-loaded settings to hand to the worker
     """
     # Configure logging
     logging.basicConfig(
@@ -203,7 +203,7 @@ def main():
     
     logger.info("Starting unified worker process")
     
-    worker = UnifiedWorker()
+    worker = UnifiedWorker(settings)
     try:
         worker.start()
     except KeyboardInterrupt:
@@ -3,9 +3,19 @@
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+import doc_healing.config
 from doc_healing.db.base import Base
 
 
+@pytest.fixture(autouse=True)
+def clear_settings_cache():
+    """Re-read settings from the environment for every test."""
+    # Looked up through the module so reloads of doc_healing.config are honoured
+    doc_healing.config._build_settings.cache_clear()
+    yield
+    doc_healing.config._build_settings.cache_clear()
+
+
 @pytest.fixture(scope="session")
 def test_db_engine():
     """Create a test database engine."""
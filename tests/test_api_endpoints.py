@@ -160,3 +160,47 @@ def test_validation_endpoint_with_missing_fields(client):
     
     # Should return 422 Unprocessable Entity for validation error
     assert response.status_code == 422
+
+
+def test_github_webhook_rejects_malformed_json(client):
+    """Test GitHub webhook endpoint returns 422 for a body that is not a JSON object."""
+    response = client.post(
+        "/webhooks/github",
+        content=b"not json",
+        headers={"Content-Type": "application/json"},
+    )
+    
+    assert response.status_code == 422
+
+
+def test_gitlab_webhook_forwards_full_payload(client, monkeypatch):
+    """Test GitLab webhook endpoint passes provider-specific fields to the task."""
+    from doc_healing.api import main
+    
+    captured = {}
+    
+    class RecordingQueue:
+        def enqueue(self, queue_name, func, *args, **kwargs):
+            captured["args"] = args
+            return type("Task", (), {"id": "task-1"})()
+    
+    monkeypatch.setattr(main.app.state, "queue", RecordingQueue(), raising=False)
+    payload = {"object_kind": "merge_request", "project": {"id": 7}}
+    
+    response = client.post("/webhooks/gitlab", json=payload)
+    
+    assert response.status_code == 200
+    assert response.json() == {"task_id": "task-1", "status": "queued", "queue_name": "webhooks"}
+    assert captured["args"] == (payload,)
+
+
+def test_gitlab_webhook_rejects_malformed_json(client):
+    """Test GitLab webhook endpoint reports orjson decode errors as 422."""
+    response = client.post(
+        "/webhooks/gitlab",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"},
+    )
+    
+    assert response.status_code == 422
+    assert response.headers["content-type"] == "application/json"
@@ -56,10 +56,8 @@ def test_api_startup_full_mode(monkeypatch):
         importlib.reload(sys.modules['doc_healing.api.main'])
     
     # Mock the database engine to avoid actual PostgreSQL connection
-    with patch("doc_healing.api.main.engine") as mock_engine, \
-         patch("doc_healing.api.main.Base") as mock_base:
-        mock_engine.connect = MagicMock()
-        mock_base.metadata.create_all = MagicMock()
+    with patch("doc_healing.api.main.get_engine") as mock_get_engine, \
+         patch("doc_healing.api.main.create_missing_tables") as mock_create_tables:
         
         # Import after setting environment variables
         from doc_healing.api.main import app
@@ -70,6 +68,9 @@ def test_api_startup_full_mode(monkeypatch):
             response = client.get("/health")
             assert response.status_code == 200
             assert response.json()["status"] == "healthy"
+        
+        # PostgreSQL schemas are created offline unless explicitly enabled
+        mock_create_tables.assert_not_called()
 
 
 def test_api_startup_logging(monkeypatch, tmp_path, caplog):
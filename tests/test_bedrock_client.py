@@ -0,0 +1,112 @@
+"""Tests for the Bedrock LLM client."""
+
+from unittest.mock import patch
+
+import pytest
+
+from doc_healing.config import Settings
+from doc_healing.llm import bedrock_client
+from doc_healing.llm.bedrock_client import BedrockLLMClient
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache(monkeypatch):
+    """Build a fresh boto3 client and correction cache in every test."""
+    monkeypatch.setenv("DOC_HEALING_QUEUE_BACKEND", "memory")
+    bedrock_client._get_bedrock_client.cache_clear()
+    bedrock_client._corrections.clear()
+    yield
+    bedrock_client._get_bedrock_client.cache_clear()
+    bedrock_client._corrections.clear()
+
+
+def test_boto3_client_is_shared_per_region():
+    """Test that LLM clients in the same region reuse one boto3 client."""
+    with patch("boto3.client") as mock_client:
+        first = BedrockLLMClient(region_name="ap-south-1")
+        second = BedrockLLMClient(region_name="ap-south-1")
+        other = BedrockLLMClient(region_name="us-east-1")
+
+    assert first.client is second.client
+    assert mock_client.call_count == 2
+    assert other.client is mock_client.return_value
+
+
+def test_boto3_client_pool_matches_worker_threads():
+    """Test that the shared client pools a connection per worker thread."""
+    settings = bedrock_client.get_settings()
+    with patch("boto3.client") as mock_client:
+        BedrockLLMClient()
+
+    config = mock_client.call_args.kwargs["config"]
+    assert config.max_pool_connections == settings.worker_threads
+    assert config.retries == {"mode": "adaptive"}
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("```python\nprint('hi')\n```", "print('hi')"),
+        ("  ```\nx = 1\n```  \n", "x = 1"),
+        ("x = 1", "x = 1"),
+        ("Here is the fix:\n```python\nx = 1\n```", "Here is the fix:\n```python\nx = 1\n```"),
+    ],
+)
+def test_strip_code_fences(raw, expected):
+    """Test that only a response made of a single fenced block is unwrapped."""
+    assert BedrockLLMClient._strip_code_fences(raw) == expected
+
+
+def test_generate_correction_sends_static_request_parts():
+    """Test that the Converse request carries the prompt and shared static parts."""
+    with patch("boto3.client") as mock_client:
+        converse = mock_client.return_value.converse
+        converse.return_value = {"output": {"message": {"content": [{"text": "```\nfixed\n```"}]}}}
+        client = BedrockLLMClient()
+
+        assert client.generate_correction("broken", "You fix code.") == "fixed"
+        client.generate_correction("broken again", "You fix code.")
+
+    first, second = (call.kwargs for call in converse.call_args_list)
+    assert first["messages"][0]["content"] == [{"text": "broken"}]
+    assert first["system"] == [{"text": "You fix code."}, {"cachePoint": {"type": "default"}}]
+    assert first["inferenceConfig"] == {"maxTokens": 4096, "temperature": 0.1}
+    assert second["system"] is first["system"]
+
+
+def test_importing_client_module_defers_boto3():
+    """Test that boto3 is only imported once a Bedrock client is built."""
+    import os
+    import subprocess
+    import sys
+
+    code = "import sys, doc_healing.workers.tasks; print('boto3' in sys.modules)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+
+    assert out.stdout.strip() == "False"
+
+
+def test_prompt_caching_can_be_disabled(monkeypatch):
+    """Test that no cache point is sent when prompt caching is turned off."""
+    monkeypatch.setattr(bedrock_client, "get_settings", lambda: Settings(bedrock_prompt_caching=False))
+    with patch("boto3.client") as mock_client:
+        converse = mock_client.return_value.converse
+        converse.return_value = {"output": {"message": {"content": [{"text": "fixed"}]}}}
+        BedrockLLMClient().generate_correction("broken", "You fix code.")
+
+    assert converse.call_args.kwargs["system"] == [{"text": "You fix code."}]
+
+
+def test_identical_prompts_reuse_the_cached_correction():
+    """Test that a repeated prompt is answered without calling Bedrock again."""
+    with patch("boto3.client") as mock_client:
+        converse = mock_client.return_value.converse
+        converse.return_value = {"output": {"message": {"content": [{"text": "fixed"}]}}}
+        client = BedrockLLMClient()
+
+        assert client.generate_correction("broken", "You fix code.") == "fixed"
+        assert client.generate_correction("broken", "You fix code.") == "fixed"
+        client.generate_correction("broken", "Another system prompt.")
+
+    assert converse.call_count == 2
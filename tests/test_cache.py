@@ -0,0 +1,49 @@
+"""Tests for the shared result cache."""
+
+from unittest.mock import MagicMock, patch
+
+from doc_healing.cache import ResultCache
+
+
+def test_result_cache_evicts_least_recently_used(monkeypatch):
+    """Test that the in-process cache stays bounded."""
+    monkeypatch.setenv("DOC_HEALING_QUEUE_BACKEND", "memory")
+    cache = ResultCache("test", maxsize=2, ttl=60)
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_result_cache_shares_hits_through_redis(monkeypatch):
+    """Test that results stored by another worker are read from Redis."""
+    monkeypatch.setenv("DOC_HEALING_QUEUE_BACKEND", "redis")
+    redis = MagicMock()
+    redis.get.return_value = b"from another worker"
+    cache = ResultCache("correction", maxsize=8, ttl=60)
+
+    with patch("doc_healing.queue.redis_client.get_redis_client", return_value=redis):
+        assert cache.get("k") == "from another worker"
+        cache.set("k2", "fixed")
+
+    redis.get.assert_called_once_with("doc_healing:correction:k")
+    redis.set.assert_called_once_with("doc_healing:correction:k2", "fixed", ex=60)
+
+
+def test_result_cache_treats_redis_errors_as_misses(monkeypatch):
+    """Test that an unreachable Redis degrades to the in-process cache."""
+    monkeypatch.setenv("DOC_HEALING_QUEUE_BACKEND", "redis")
+    redis = MagicMock()
+    redis.get.side_effect = ConnectionError("down")
+    redis.set.side_effect = ConnectionError("down")
+    cache = ResultCache("test", maxsize=8, ttl=60)
+
+    with patch("doc_healing.queue.redis_client.get_redis_client", return_value=redis):
+        assert cache.get("k") is None
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
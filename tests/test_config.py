@@ -102,11 +102,37 @@ def test_api_configuration(monkeypatch):
 
 def test_get_settings_singleton():
     """Test that get_settings returns a singleton instance."""
-    # Clear the global settings
+    # Clear the cached settings
     import doc_healing.config
-    doc_healing.config._settings = None
+    doc_healing.config._build_settings.cache_clear()
     
     settings1 = get_settings()
     settings2 = get_settings()
     
     assert settings1 is settings2
+
+
+def test_settings_are_frozen():
+    """Test that settings cannot be mutated after construction."""
+    from pydantic import ValidationError
+
+    settings = Settings()
+
+    with pytest.raises(ValidationError):
+        settings.api_port = 9000
+
+
+def test_aws_secret_overrides(monkeypatch):
+    """Test that AWS secrets are applied when the settings are built."""
+    from unittest.mock import patch
+
+    monkeypatch.setenv("DOC_HEALING_AWS_SECRET_NAME", "doc-healing/prod")
+    monkeypatch.setenv("DOC_HEALING_REDIS_HOST", "env-host")
+    secrets = {"DATABASE_URL": "postgresql://aws/db", "REDIS_PORT": "6390"}
+
+    with patch("doc_healing.aws.secrets.get_secret", return_value=secrets):
+        settings = get_settings()
+
+    assert settings.database_url == "postgresql://aws/db"
+    assert settings.redis_port == 6390
+    assert settings.redis_host == "env-host"
@@ -74,8 +74,39 @@ class TestDatabaseConnectionFactory:
             assert "postgresql" in str(engine.url)
             
             # Verify PostgreSQL-specific configuration (connection pooling)
-            assert engine.pool.size() == 5  # pool_size=5
-            assert engine.pool._max_overflow == 10  # max_overflow=10
+            assert engine.pool.size() == 8  # worker_threads * 2
+            assert engine.pool._max_overflow == 16  # worker_threads * 4
+            assert engine.pool._recycle == 1800
+
+    def test_create_db_engine_sqlite_enables_wal(self):
+        """Test that file-backed SQLite connections use WAL journaling."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch("doc_healing.db.connection.get_settings") as mock_settings:
+                mock_settings.return_value = Settings(
+                    database_backend=DatabaseBackend.SQLITE,
+                    sqlite_path=os.path.join(tmp_dir, "wal.db")
+                )
+                
+                engine = create_db_engine()
+                with engine.connect() as conn:
+                    mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+                engine.dispose()
+            
+            assert mode == "wal"
+
+    def test_create_db_engine_sqlite_memory_shares_connection(self):
+        """Test that an in-memory SQLite database is shared across sessions."""
+        from sqlalchemy.pool import StaticPool
+
+        with patch("doc_healing.db.connection.get_settings") as mock_settings:
+            mock_settings.return_value = Settings(
+                database_backend=DatabaseBackend.SQLITE,
+                sqlite_path=":memory:"
+            )
+            
+            engine = create_db_engine()
+        
+        assert isinstance(engine.pool, StaticPool)
 
     def test_get_db_yields_session(self):
         """Test that get_db yields a valid database session."""
@@ -137,3 +168,80 @@ class TestDatabaseConnectionFactory:
         finally:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
+
+    def test_get_engine_is_created_once(self):
+        """Test that the shared engine is built lazily and then reused."""
+        from doc_healing.db import connection
+
+        connection.get_engine.cache_clear()
+        try:
+            with patch("doc_healing.db.connection.create_db_engine") as mock_create:
+                assert connection.get_engine() is connection.get_engine()
+                assert connection.engine is mock_create.return_value
+                assert mock_create.call_count == 1
+        finally:
+            connection.get_engine.cache_clear()
+
+
+class TestCreateMissingTables:
+    """Test schema bootstrap helper."""
+
+    def test_creates_only_missing_tables(self):
+        """Test that existing tables are left alone and missing ones are created."""
+        from sqlalchemy import create_engine, inspect
+        from doc_healing.db.base import Base, create_missing_tables
+
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.tables["repositories"].create(engine)
+
+        created = create_missing_tables(engine)
+
+        assert "repositories" not in created
+        assert set(created) == set(Base.metadata.tables) - {"repositories"}
+        assert set(inspect(engine).get_table_names()) == set(Base.metadata.tables)
+        assert create_missing_tables(engine) == []
+
+    def test_pending_webhook_index_is_partial(self):
+        """Test that the pending-webhook index only covers pending rows."""
+        from sqlalchemy import create_engine
+        from doc_healing.db.base import create_missing_tables
+
+        engine = create_engine("sqlite:///:memory:")
+        create_missing_tables(engine)
+
+        with engine.connect() as conn:
+            ddl = conn.exec_driver_sql(
+                "SELECT sql FROM sqlite_master WHERE name = 'idx_webhook_pending'"
+            ).scalar()
+
+        assert "WHERE status = 'pending'" in ddl
+
+    def test_payload_gin_index_is_postgresql_only(self):
+        """Test that the JSONB GIN index is skipped on SQLite."""
+        from sqlalchemy import create_engine, inspect
+        from doc_healing.db.base import create_missing_tables
+
+        engine = create_engine("sqlite:///:memory:")
+        create_missing_tables(engine)
+
+        names = {index["name"] for index in inspect(engine).get_indexes("webhook_events")}
+        assert "idx_webhook_pending" in names
+        assert "idx_webhook_payload_gin" not in names
+
+    def test_timestamps_are_generated_by_the_database(self):
+        """Test that created_at is filled in by the server default on insert."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+        from doc_healing.db.base import create_missing_tables
+        from doc_healing.db.models import Repository
+
+        engine = create_engine("sqlite:///:memory:")
+        create_missing_tables(engine)
+
+        with Session(engine) as session:
+            repo = Repository(platform="github", owner="o", name="r", full_name="o/r")
+            session.add(repo)
+            session.commit()
+
+            assert repo.created_at is not None
+            assert repo.updated_at is not None
@@ -0,0 +1,39 @@
+"""Tests for bulk metrics inserts."""
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session
+
+from doc_healing.db.base import create_missing_tables
+from doc_healing.db.metrics import bulk_insert_metrics
+from doc_healing.db.models import SystemMetricsDB
+
+
+def test_bulk_insert_metrics_uses_one_executemany():
+    """Test that all rows are written with a single INSERT execution."""
+    engine = create_engine("sqlite:///:memory:")
+    create_missing_tables(engine)
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    rows = [{"webhook_queue_depth": depth, "active_containers": 1} for depth in range(25)]
+
+    with Session(engine) as session:
+        assert bulk_insert_metrics(session, SystemMetricsDB, rows) == 25
+        session.commit()
+        count = session.scalar(select(func.count()).select_from(SystemMetricsDB))
+
+    inserts = [s for s in statements if s.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert "RETURNING" not in inserts[0]
+    assert count == 25
+
+
+def test_bulk_insert_metrics_skips_empty_batches():
+    """Test that an empty batch does not touch the database."""
+    engine = create_engine("sqlite:///:memory:")
+
+    with Session(engine) as session:
+        assert bulk_insert_metrics(session, SystemMetricsDB, []) == 0
@@ -1,5 +1,6 @@
 """Tests for in-memory queue backend implementation."""
 
+import logging
 import sys
 import time
 import threading
@@ -54,7 +55,6 @@ def test_memory_backend_initialization_sync():
         
         assert backend.sync_processing is True
         assert backend.worker_threads == 2
-        assert backend.queues == {}
         assert backend.tasks == {}
         assert len(backend.workers) == 0  # No workers in sync mode
 
@@ -72,12 +72,24 @@ def test_memory_backend_initialization_async():
         assert backend.sync_processing is False
         assert backend.worker_threads == 3
         assert backend.running is True
-        assert len(backend.workers) == 3  # Workers started in async mode
+        assert backend._pool._max_workers == 3  # Pool sized for async mode
         
         # Cleanup
         backend.shutdown()
 
 
+def test_async_workers_start_on_first_enqueue(async_backend):
+    """Test that no worker threads exist until work is enqueued."""
+    assert async_backend.workers == []
+    
+    done = threading.Event()
+    async_backend.enqueue("test_queue", done.set)
+    
+    assert done.wait(timeout=2.0)
+    assert 1 <= len(async_backend.workers) <= 2
+    assert all(w.name.startswith("MemoryQueueWorker") for w in async_backend.workers)
+
+
 def test_enqueue_sync_executes_immediately(sync_backend):
     """Test that enqueue executes tasks immediately in sync mode."""
     executed = []
@@ -143,25 +155,6 @@ def test_enqueue_async_handles_errors(async_backend):
     assert task.id not in async_backend.tasks
 
 
-def test_get_queue_creates_queue_once(sync_backend):
-    """Test that _get_queue creates a queue only once per queue name."""
-    queue1 = sync_backend._get_queue("test_queue")
-    queue2 = sync_backend._get_queue("test_queue")
-    
-    assert queue1 is queue2
-    assert "test_queue" in sync_backend.queues
-
-
-def test_get_queue_creates_different_queues(sync_backend):
-    """Test that _get_queue creates separate queues for different names."""
-    queue1 = sync_backend._get_queue("webhooks")
-    queue2 = sync_backend._get_queue("validation")
-    
-    assert queue1 is not queue2
-    assert "webhooks" in sync_backend.queues
-    assert "validation" in sync_backend.queues
-
-
 def test_get_task_returns_none_for_empty_queue(sync_backend):
     """Test that get_task returns None when queue is empty."""
     task = sync_backend.get_task("empty_queue", timeout=0)
@@ -187,6 +180,76 @@ def test_get_task_returns_queued_task(async_backend):
     time.sleep(1.5)
 
 
+def test_get_task_peek_keeps_fifo_order(async_backend):
+    """Test that repeated peeks neither reorder nor re-run queued tasks."""
+    release = threading.Event()
+    runs = []
+    lock = threading.Lock()
+    
+    def test_func(value):
+        release.wait(timeout=2.0)
+        with lock:
+            runs.append(value)
+    
+    tasks = [async_backend.enqueue("test_queue", test_func, i) for i in range(4)]
+    
+    for _ in range(3):
+        assert async_backend.get_task("test_queue", timeout=0).id == tasks[0].id
+    
+    release.set()
+    time.sleep(0.5)
+    
+    assert sorted(runs) == [0, 1, 2, 3]
+    assert async_backend.get_task("test_queue", timeout=0) is None
+
+
+def test_get_queue_length_counts_unfinished_tasks(async_backend):
+    """Test that get_queue_length counts only the named queue's tasks."""
+    release = threading.Event()
+    
+    def test_func():
+        release.wait(timeout=2.0)
+    
+    for _ in range(3):
+        async_backend.enqueue("validation", test_func)
+    async_backend.enqueue("healing", test_func)
+    
+    assert async_backend.get_queue_length("validation") == 3
+    assert async_backend.get_queue_length("healing") == 1
+    
+    release.set()
+    time.sleep(0.5)
+    
+    assert async_backend.get_queue_length("validation") == 0
+
+
+def test_enqueue_unique_skips_pending_duplicates(async_backend):
+    """Test that a dedupe key is enqueued again only after its task finishes."""
+    release = threading.Event()
+    
+    def test_func():
+        release.wait(timeout=2.0)
+    
+    first = async_backend.enqueue_unique("healing", "README.md:s-1", test_func)
+    duplicate = async_backend.enqueue_unique("healing", "README.md:s-1", test_func)
+    other = async_backend.enqueue_unique("healing", "README.md:s-2", test_func)
+    
+    assert first is not None
+    assert duplicate is None
+    assert other is not None
+    
+    release.set()
+    time.sleep(0.5)
+    
+    assert async_backend.enqueue_unique("healing", "README.md:s-1", test_func) is not None
+    
+    time.sleep(0.5)
+    
+    # Finished tasks leave no dedupe bookkeeping behind
+    assert async_backend._unique == {}
+    assert async_backend._unique_keys == {}
+
+
 def test_get_task_with_timeout(async_backend):
     """Test that get_task respects timeout parameter."""
     # Try to get from empty queue with short timeout
@@ -298,6 +361,11 @@ def test_multiple_queues_async(async_backend):
 def test_shutdown_stops_workers(async_backend):
     """Test that shutdown stops all worker threads."""
     assert async_backend.running is True
+    
+    # The pool starts threads on demand
+    done = threading.Event()
+    async_backend.enqueue("test_queue", done.set)
+    assert done.wait(timeout=1)
     assert len(async_backend.workers) > 0
     
     # Get initial worker threads
@@ -372,3 +440,72 @@ def test_concurrent_enqueue(async_backend):
     # All tasks should be executed
     assert len(results) == 10
     assert set(results) == set(range(10))
+
+
+def test_enqueue_many_async(async_backend):
+    """Test that enqueue_many registers and runs every job in order."""
+    results = []
+    lock = threading.Lock()
+    
+    def test_func(value, scale=1):
+        with lock:
+            results.append(value * scale)
+    
+    jobs = [(test_func, (i,), {"scale": 2}) for i in range(5)]
+    tasks = async_backend.enqueue_many("test_queue", jobs)
+    
+    assert [task.args for task in tasks] == [(i,) for i in range(5)]
+    assert all(task.kwargs == {"scale": 2} for task in tasks)
+    assert all(task.queue_name == "test_queue" for task in tasks)
+    assert len({task.id for task in tasks}) == 5
+    
+    time.sleep(1.0)
+    
+    assert sorted(results) == [0, 2, 4, 6, 8]
+    for task in tasks:
+        assert task.id not in async_backend.tasks
+
+
+def test_enqueue_many_sync(sync_backend):
+    """Test that enqueue_many executes jobs immediately in sync mode."""
+    results = []
+    
+    def test_func(value):
+        results.append(value)
+    
+    tasks = sync_backend.enqueue_many("test_queue", [(test_func, (1,), {}), (test_func, (2,), {})])
+    
+    assert results == [1, 2]
+    assert len(tasks) == 2
+    assert len(sync_backend.tasks) == 0
+
+
+def test_task_ids_are_unique(sync_backend):
+    """Test that task IDs stay unique across many enqueues."""
+    def test_func():
+        pass
+    
+    ids = [sync_backend.enqueue("test_queue", test_func).id for _ in range(1000)]
+    
+    assert len(set(ids)) == 1000
+
+
+def test_async_failure_logs_traceback_only_at_debug(async_backend, caplog):
+    """Test that worker failures log a traceback only when DEBUG is enabled."""
+    def failing_func():
+        raise ValueError("boom")
+    
+    caplog.set_level(logging.INFO, logger="doc_healing.queue.memory_backend")
+    async_backend.enqueue("test_queue", failing_func)
+    time.sleep(0.5)
+    
+    failures = [r for r in caplog.records if "ValueError('boom')" in r.getMessage()]
+    assert failures
+    assert not any(r.exc_info for r in caplog.records)
+    
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="doc_healing.queue.memory_backend")
+    async_backend.enqueue("test_queue", failing_func)
+    time.sleep(0.5)
+    
+    assert any(r.exc_info for r in caplog.records)
@@ -46,9 +46,9 @@ def test_async_mode_worker_threads():
         
         backend = MemoryQueueBackend()
         
-        # Verify workers are started
+        # Verify the worker pool is started
         assert backend.running is True
-        assert len(backend.workers) == 3
+        assert backend._pool._max_workers == 3
         
         # Track execution
         results = []
@@ -169,7 +169,7 @@ def test_no_persistence_across_restarts():
         
         # Task should not exist in new instance
         assert task.id not in backend2.tasks
-        assert "test_queue" not in backend2.queues or backend2.queues["test_queue"].empty()
+        assert backend2.get_task("test_queue", timeout=0) is None
         
         # Cleanup
         backend2.shutdown()
@@ -25,3 +25,30 @@ def test_property_memory_metrics_logging(memory_dict, caplog):
         log_memory_usage("test_context")
         assert "Memory Usage [test_context]:" in caplog.text
         assert str(round(memory_dict["percent"], 2)) in caplog.text
+
+
+def test_get_memory_usage_reuses_process_handle():
+    """The psutil Process handle is created once, not on every call."""
+    with patch('doc_healing.monitoring.memory.psutil.Process') as process_cls:
+        first = get_memory_usage()
+        second = get_memory_usage()
+    process_cls.assert_not_called()
+    assert first.keys() == second.keys()
+    assert 0 < first["percent"] <= 100
+
+
+def test_log_memory_usage_skips_psutil_when_info_disabled(caplog):
+    """No memory metrics are gathered when INFO logging is off."""
+    caplog.set_level(logging.WARNING, logger="doc_healing.monitoring.memory")
+    with patch('doc_healing.monitoring.memory.get_memory_usage') as get_usage:
+        log_memory_usage("quiet")
+    get_usage.assert_not_called()
+    assert "Memory Usage" not in caplog.text
+
+
+def test_get_memory_usage_process_only_skips_system_sample():
+    """Process-only sampling does not read system-wide memory."""
+    with patch('doc_healing.monitoring.memory.psutil.virtual_memory') as virtual_memory:
+        metrics = get_memory_usage(include_system=False)
+    virtual_memory.assert_not_called()
+    assert set(metrics) == {"rss", "vms", "percent"}
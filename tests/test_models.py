@@ -8,6 +8,9 @@ from doc_healing.models import (
     ValidationResult,
     ErrorType,
     ExecutionError,
+    CodeSymbol,
+    SymbolType,
+    Visibility,
 )
 
 
@@ -28,6 +31,19 @@ def test_repository_info_creation():
     assert repo.installation_id == 12345
 
 
+@pytest.mark.unit
+def test_repository_info_is_frozen_and_hashable():
+    """Test that RepositoryInfo instances are immutable slotted values."""
+    import dataclasses
+
+    repo = RepositoryInfo(platform="github", owner="o", name="r", full_name="o/r")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        repo.name = "other"
+    assert not hasattr(repo, "__dict__")
+    assert {repo: 1}[RepositoryInfo("github", "o", "r", "o/r")] == 1
+
+
 @pytest.mark.unit
 def test_code_snippet_creation():
     """Test creating a CodeSnippet instance."""
@@ -77,3 +93,35 @@ def test_validation_result_failure():
     assert result.error.type == ErrorType.SYNTAX
     assert result.error.message == "SyntaxError: invalid syntax"
     assert result.error.line == 1
+
+
+@pytest.mark.unit
+def test_error_type_from_stored_value_is_member():
+    """Test that values read back from string columns resolve to the enum singletons."""
+    for member in ErrorType:
+        assert ErrorType(member.value) is member
+    error = ExecutionError(type=ErrorType("runtime"), message="ZeroDivisionError")
+    assert error.type is ErrorType.RUNTIME
+
+
+@pytest.mark.unit
+def test_code_symbol_from_dicts():
+    """Test building CodeSymbols from parsed rows."""
+    symbols = CodeSymbol.from_dicts([
+        {"name": "run", "type": "function", "signature": "run()", "file": "a.py", "line": 3, "visibility": "public"},
+        {"name": "Base", "type": "class", "signature": "class Base", "file": "b.py", "line": 1, "visibility": "private"},
+    ])
+    assert [symbol.name for symbol in symbols] == ["run", "Base"]
+    assert symbols[0].type is SymbolType.FUNCTION
+    assert symbols[1].visibility is Visibility.PRIVATE
+    assert symbols[1].line == 1
+
+
+@pytest.mark.unit
+def test_snippets_and_symbols_are_hashable_keys():
+    """Test that CodeSnippet and CodeSymbol values can key sets and dicts."""
+    snippet = CodeSnippet("s-1", "python", "import requests", "README.md", 1, 2, ("requests",))
+    symbol = CodeSymbol("run", SymbolType.FUNCTION, "run()", "a.py", 3, Visibility.PUBLIC)
+
+    assert len({snippet, snippet._replace()}) == 1
+    assert {symbol: "a.py"}[CodeSymbol("run", SymbolType.FUNCTION, "run()", "a.py", 3, Visibility.PUBLIC)] == "a.py"
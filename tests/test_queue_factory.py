@@ -1,6 +1,7 @@
 """Tests for queue backend factory."""
 
 import sys
+import threading
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -33,7 +34,7 @@ def test_get_queue_backend_returns_redis_backend():
         settings.redis_db = 0
         mock_settings.return_value = settings
         
-        with patch('doc_healing.queue.redis_backend.Redis'):
+        with patch('doc_healing.queue.redis_backend.get_redis_client'):
             backend = get_queue_backend()
             
             assert isinstance(backend, RedisQueueBackend)
@@ -116,7 +117,7 @@ def test_reset_queue_backend_does_not_call_shutdown_on_redis_backend():
         settings.redis_db = 0
         mock_settings.return_value = settings
         
-        with patch('doc_healing.queue.redis_backend.Redis'):
+        with patch('doc_healing.queue.redis_backend.get_redis_client'):
             backend = get_queue_backend()
             
             # Redis backend doesn't have shutdown method
@@ -147,26 +148,17 @@ def test_factory_logs_backend_initialization():
 def test_factory_with_redis_backend_configuration():
     """Test factory with full Redis backend configuration."""
     with patch('doc_healing.queue.factory.get_settings') as mock_factory_settings:
-        with patch('doc_healing.queue.redis_backend.get_settings') as mock_redis_settings:
-            settings = MagicMock()
-            settings.queue_backend = QueueBackendEnum.REDIS
-            settings.deployment_mode = MagicMock(value="full")
-            settings.redis_host = "redis.example.com"
-            settings.redis_port = 6380
-            settings.redis_db = 1
-            settings.redis_url = None
-            mock_factory_settings.return_value = settings
-            mock_redis_settings.return_value = settings
+        settings = MagicMock()
+        settings.queue_backend = QueueBackendEnum.REDIS
+        settings.deployment_mode = MagicMock(value="full")
+        mock_factory_settings.return_value = settings
+        
+        with patch('doc_healing.queue.redis_backend.get_redis_client') as mock_get_conn:
+            backend = get_queue_backend()
             
-            with patch('doc_healing.queue.redis_backend.Redis') as mock_redis:
-                backend = get_queue_backend()
-                
-                # Verify Redis was initialized with correct settings
-                mock_redis.assert_called_once()
-                call_kwargs = mock_redis.call_args[1]
-                assert call_kwargs['host'] == "redis.example.com"
-                assert call_kwargs['port'] == 6380
-                assert call_kwargs['db'] == 1
+            # The backend runs on the process-wide RQ connection
+            mock_get_conn.assert_called_once_with()
+            assert backend.redis_conn is mock_get_conn.return_value
 
 
 def test_factory_with_memory_backend_configuration():
@@ -195,3 +187,30 @@ def test_reset_queue_backend_when_none_exists():
     # Should not raise an error
     reset_queue_backend()
     reset_queue_backend()  # Call twice to ensure idempotency
+
+
+def test_concurrent_first_calls_build_one_backend():
+    """Test that racing first calls share a single backend instance."""
+    with patch('doc_healing.queue.factory.get_settings') as mock_settings:
+        settings = MagicMock()
+        settings.queue_backend = QueueBackendEnum.REDIS
+        settings.deployment_mode = MagicMock(value="full")
+        mock_settings.return_value = settings
+        
+        barrier = threading.Barrier(8)
+        results = []
+        
+        def call():
+            barrier.wait()
+            results.append(get_queue_backend())
+        
+        with patch('doc_healing.queue.redis_backend.get_redis_client'):
+            with patch('doc_healing.queue.redis_backend.RedisQueueBackend.__init__', return_value=None) as init:
+                threads = [threading.Thread(target=call) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        
+        assert init.call_count == 1
+        assert len({id(backend) for backend in results}) == 1
@@ -0,0 +1,30 @@
+"""Tests for the RQ job serializer."""
+
+from doc_healing.queue.serializer import OrjsonSerializer
+
+
+def test_roundtrips_job_payload():
+    """Test that an RQ-shaped job payload survives a dump/load cycle."""
+    payload = (
+        "doc_healing.workers.tasks.heal_code_snippet",
+        None,
+        ("README.md", "snippet-0-abc", "print(1)", "python", [{"message": "bad", "line": 3}]),
+        {"retry": True},
+    )
+
+    data = OrjsonSerializer.dumps(payload)
+    func_name, instance, args, kwargs = OrjsonSerializer.loads(data)
+
+    assert isinstance(data, bytes)
+    assert func_name == payload[0]
+    assert instance is None
+    assert tuple(args) == payload[2]
+    assert kwargs == {"retry": True}
+
+
+def test_binds_orjson_functions_directly():
+    """Test that serialization calls go straight to orjson."""
+    import orjson
+
+    assert OrjsonSerializer.dumps is orjson.dumps
+    assert OrjsonSerializer.loads is orjson.loads
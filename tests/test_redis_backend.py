@@ -1,6 +1,7 @@
 """Tests for Redis queue backend implementation."""
 
 import sys
+import zlib
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 
@@ -8,17 +9,17 @@ from unittest.mock import Mock, MagicMock, patch
 sys.modules['rq'] = MagicMock()
 sys.modules['rq.job'] = MagicMock()
 
-from doc_healing.queue.redis_backend import RedisQueueBackend
-from doc_healing.queue.base import Task
+from doc_healing.queue.redis_backend import RedisQueueBackend, _release_dedupe_claim
+from doc_healing.queue.base import QUEUE_NAMES, Task
+from doc_healing.queue.serializer import OrjsonSerializer
 
 
 @pytest.fixture
 def mock_redis():
     """Create a mock Redis connection."""
-    with patch('doc_healing.queue.redis_backend.Redis') as mock_redis_class:
+    with patch('doc_healing.queue.redis_backend.get_redis_client') as mock_get_conn:
         mock_conn = MagicMock()
-        mock_redis_class.return_value = mock_conn
-        mock_redis_class.from_url.return_value = mock_conn
+        mock_get_conn.return_value = mock_conn
         yield mock_conn
 
 
@@ -32,8 +33,8 @@ def mock_queue():
 
 
 @pytest.fixture
-def redis_backend(mock_redis):
-    """Create a RedisQueueBackend instance with mocked Redis."""
+def redis_backend(mock_redis, mock_queue):
+    """Create a RedisQueueBackend instance with mocked Redis and RQ queues."""
     return RedisQueueBackend()
 
 
@@ -41,8 +42,8 @@ def test_redis_backend_initialization(mock_redis):
     """Test that Redis backend initializes with correct settings."""
     backend = RedisQueueBackend()
     
-    assert backend.redis_conn is not None
-    assert backend.queues == {}
+    assert backend.redis_conn is mock_redis
+    assert set(backend.queues) == set(QUEUE_NAMES)
 
 
 def test_enqueue_creates_task(redis_backend, mock_queue):
@@ -106,50 +107,59 @@ def test_get_queue_creates_different_queues(redis_backend):
         mock_queue_class.side_effect = [mock_q1, mock_q2]
         
         # Get two different queues
-        queue1 = redis_backend._get_queue("webhooks")
-        queue2 = redis_backend._get_queue("validation")
+        queue1 = redis_backend._get_queue("reports")
+        queue2 = redis_backend._get_queue("audits")
         
         # Should create both
         assert mock_queue_class.call_count == 2
         assert queue1 is not queue2
-        assert "webhooks" in redis_backend.queues
-        assert "validation" in redis_backend.queues
+        assert "reports" in redis_backend.queues
+        assert "audits" in redis_backend.queues
+
+
+def test_known_queues_are_built_up_front(mock_redis):
+    """Test that the application's queues exist before the first enqueue."""
+    with patch('doc_healing.queue.redis_backend.Queue') as mock_queue_class:
+        backend = RedisQueueBackend()
+        
+        assert mock_queue_class.call_count == len(QUEUE_NAMES)
+        backend._get_queue("validation")
+        assert mock_queue_class.call_count == len(QUEUE_NAMES)
 
 
 def test_get_task_returns_none_for_empty_queue(redis_backend, mock_queue):
     """Test that get_task returns None when queue is empty."""
-    mock_queue.job_ids = []
+    redis_backend._peek_head.return_value = None
     
     task = redis_backend.get_task("empty_queue")
     
     assert task is None
 
 
+def test_get_task_returns_none_for_expired_job(redis_backend, mock_queue):
+    """Test that get_task returns None when the head job's hash is gone."""
+    redis_backend._peek_head.return_value = [b"job-1"]
+    
+    assert redis_backend.get_task("test_queue") is None
+
+
 def test_get_task_returns_first_task(redis_backend, mock_queue):
     """Test that get_task returns the first task in the queue."""
-    with patch('doc_healing.queue.redis_backend.Job') as mock_job_class:
-        # Setup mock queue with job IDs
-        mock_queue.job_ids = ["job-1", "job-2", "job-3"]
-        
-        # Setup mock job
-        mock_job = MagicMock()
-        mock_job.id = "job-1"
-        mock_job.func_name = "test_function"
-        mock_job.args = ("arg1",)
-        mock_job.kwargs = {"key": "value"}
-        mock_job_class.fetch.return_value = mock_job
-        
-        task = redis_backend.get_task("test_queue")
-        
-        # Verify correct job was fetched
-        mock_job_class.fetch.assert_called_once_with("job-1", connection=redis_backend.redis_conn)
-        
-        # Verify task attributes
-        assert task.id == "job-1"
-        assert task.func_name == "test_function"
-        assert task.args == ("arg1",)
-        assert task.kwargs == {"key": "value"}
-        assert task.queue_name == "test_queue"
+    payload = OrjsonSerializer.dumps(["test_function", None, ["arg1"], {"key": "value"}])
+    redis_backend._peek_head.return_value = [b"job-1", zlib.compress(payload)]
+    
+    task = redis_backend.get_task("test_queue")
+    
+    # Verify the head was read in a single script call against the queue key
+    redis_backend._peek_head.assert_called_once()
+    assert redis_backend._peek_head.call_args.kwargs["keys"] == [mock_queue.key.encode.return_value]
+    
+    # Verify task attributes
+    assert task.id == "job-1"
+    assert task.func_name == "test_function"
+    assert task.args == ("arg1",)
+    assert task.kwargs == {"key": "value"}
+    assert task.queue_name == "test_queue"
 
 
 def test_mark_complete_logs_completion(redis_backend):
@@ -170,7 +180,7 @@ def test_mark_complete_logs_completion(redis_backend):
         redis_backend.mark_complete(task)
         
         # Verify job was fetched
-        mock_job_class.fetch.assert_called_once_with("job-123", connection=redis_backend.redis_conn)
+        mock_job_class.fetch.assert_called_once_with("job-123", connection=redis_backend.redis_conn, serializer=OrjsonSerializer)
 
 
 def test_mark_failed_logs_error(redis_backend):
@@ -193,7 +203,7 @@ def test_mark_failed_logs_error(redis_backend):
         redis_backend.mark_failed(task, error)
         
         # Verify job was fetched
-        mock_job_class.fetch.assert_called_once_with("job-456", connection=redis_backend.redis_conn)
+        mock_job_class.fetch.assert_called_once_with("job-456", connection=redis_backend.redis_conn, serializer=OrjsonSerializer)
 
 
 def test_mark_complete_raises_on_missing_job(redis_backend):
@@ -230,3 +240,194 @@ def test_mark_failed_raises_on_missing_job(redis_backend):
         
         with pytest.raises(Exception, match="Job not found"):
             redis_backend.mark_failed(task, error)
+
+
+def test_enqueue_many_uses_single_rq_call(redis_backend, mock_queue):
+    """Test that enqueue_many submits all jobs through one RQ enqueue_many call."""
+    job_a, job_b = MagicMock(id="job-a"), MagicMock(id="job-b")
+    mock_queue.enqueue_many.return_value = [job_a, job_b]
+    
+    def test_func(value, flag=False):
+        pass
+    
+    tasks = redis_backend.enqueue_many(
+        "validation", [(test_func, (1,), {}), (test_func, (2,), {"flag": True})]
+    )
+    
+    mock_queue.enqueue_many.assert_called_once()
+    mock_queue.enqueue.assert_not_called()
+    redis_backend.redis_conn.pipeline.assert_called_once_with(transaction=False)
+    redis_backend.redis_conn.pipeline.return_value.execute.assert_called_once()
+    assert [task.id for task in tasks] == ["job-a", "job-b"]
+    assert tasks[1].args == (2,)
+    assert tasks[1].kwargs == {"flag": True}
+    assert all(task.queue_name == "validation" for task in tasks)
+
+
+def test_enqueue_many_flushes_one_pipeline_per_batch(redis_backend, mock_queue):
+    """Test that large batches are split across several pipeline flushes."""
+    mock_queue.enqueue_many.side_effect = lambda datas, pipeline: [
+        MagicMock(id=f"job-{i}") for i in range(len(datas))
+    ]
+    
+    def test_func(value):
+        pass
+    
+    with patch('doc_healing.queue.redis_backend.ENQUEUE_BATCH_SIZE', 2):
+        tasks = redis_backend.enqueue_many("validation", [(test_func, (i,), {}) for i in range(5)])
+    
+    assert len(tasks) == 5
+    assert mock_queue.enqueue_many.call_count == 3
+    assert redis_backend.redis_conn.pipeline.return_value.execute.call_count == 3
+
+
+def module_level_task(value):
+    """Importable task used to check enqueue by dotted path."""
+
+
+def test_enqueue_passes_import_path_for_module_functions(redis_backend, mock_queue):
+    """Test that importable functions are handed to RQ as dotted paths."""
+    mock_queue.enqueue.return_value = MagicMock(id="job-789")
+    
+    task = redis_backend.enqueue("validation", module_level_task, 1)
+    
+    mock_queue.enqueue.assert_called_once_with(f"{__name__}.module_level_task", 1)
+    assert task.func_name == "module_level_task"
+
+
+def test_get_queue_length_uses_llen(redis_backend, mock_queue):
+    """Test that get_queue_length issues one LLEN on the queue key."""
+    redis_backend.redis_conn.llen.return_value = 7
+    
+    assert redis_backend.get_queue_length("validation") == 7
+    redis_backend.redis_conn.llen.assert_called_once_with(mock_queue.key.encode.return_value)
+
+
+def test_get_queue_lengths_pipelines_llen(redis_backend, mock_queue):
+    """Test that several queue lengths are read in one pipeline flush."""
+    pipe = redis_backend.redis_conn.pipeline.return_value
+    pipe.execute.return_value = [4, 0, 2]
+    
+    lengths = redis_backend.get_queue_lengths(["webhooks", "validation", "healing"])
+    
+    assert lengths == {"webhooks": 4, "validation": 0, "healing": 2}
+    assert pipe.llen.call_count == 3
+    pipe.execute.assert_called_once()
+    redis_backend.redis_conn.llen.assert_not_called()
+
+
+def test_enqueue_unique_claims_before_enqueue(redis_backend, mock_queue):
+    """Test that only the first producer of a dedupe key enqueues the task."""
+    mock_queue.enqueue_call.return_value = MagicMock(id="job-1")
+    redis_backend.redis_conn.set.side_effect = [True, None]
+    
+    def test_func(value):
+        pass
+    
+    first = redis_backend.enqueue_unique("healing", "README.md:s-1", test_func, 1)
+    second = redis_backend.enqueue_unique("healing", "README.md:s-1", test_func, 1)
+    
+    assert first.id == "job-1"
+    assert second is None
+    mock_queue.enqueue_call.assert_called_once()
+    claim_key = redis_backend.redis_conn.set.call_args.args[0]
+    assert claim_key == "doc_healing:dedupe:healing:README.md:s-1"
+    assert redis_backend.redis_conn.set.call_args.kwargs["nx"] is True
+
+
+def test_enqueue_unique_releases_claim_on_failure(redis_backend, mock_queue):
+    """Test that a failed enqueue does not leave the dedupe key claimed."""
+    mock_queue.enqueue_call.side_effect = ConnectionError("down")
+    redis_backend.redis_conn.set.return_value = True
+    
+    def test_func():
+        pass
+    
+    with pytest.raises(ConnectionError):
+        redis_backend.enqueue_unique("healing", "k", test_func)
+    
+    job_id = redis_backend.redis_conn.set.call_args.args[1]
+    redis_backend.redis_conn.eval.assert_called_once()
+    assert redis_backend.redis_conn.eval.call_args.args[1:] == (1, "doc_healing:dedupe:healing:k", job_id)
+
+
+@pytest.fixture
+def dedupe_claims(redis_backend, mock_queue):
+    """Back the dedupe SET NX and release script with a dict."""
+    claims = {}
+    
+    def fake_set(key, value, nx=False, ex=None):
+        if nx and key in claims:
+            return None
+        claims[key] = value
+        return True
+    
+    def fake_release(script, numkeys, key, job_id):
+        if claims.get(key) == job_id:
+            del claims[key]
+            return 1
+        return 0
+    
+    conn = redis_backend.redis_conn
+    conn.set.side_effect = fake_set
+    conn.eval.side_effect = fake_release
+    mock_queue.enqueue_call.side_effect = lambda **kwargs: MagicMock(id=kwargs["job_id"])
+    return claims
+
+
+def _finished_job(enqueue_call):
+    """Return the job an enqueue_call created, as a worker's callback sees it."""
+    kwargs = enqueue_call.kwargs
+    return MagicMock(id=kwargs["job_id"], meta=kwargs["meta"])
+
+
+def test_enqueue_unique_allows_repeat_once_job_finishes(redis_backend, mock_queue, dedupe_claims):
+    """Test that the job's completion callback releases the dedupe claim."""
+    def test_func():
+        pass
+    
+    first = redis_backend.enqueue_unique("healing", "k", test_func)
+    assert first is not None
+    assert redis_backend.enqueue_unique("healing", "k", test_func) is None
+    assert dedupe_claims["doc_healing:dedupe:healing:k"] == first.id
+    
+    # What the worker does after the job succeeds or fails
+    call = mock_queue.enqueue_call.call_args
+    _release_dedupe_claim(_finished_job(call), redis_backend.redis_conn, None)
+    
+    assert redis_backend.enqueue_unique("healing", "k", test_func) is not None
+    assert mock_queue.enqueue_call.call_count == 2
+    assert call.kwargs["on_success"] is call.kwargs["on_failure"]
+
+
+def test_stale_job_does_not_release_a_newer_claim(redis_backend, mock_queue, dedupe_claims):
+    """Test that a job finishing after its claim expired leaves the new claim alone."""
+    def test_func():
+        pass
+    
+    redis_backend.enqueue_unique("healing", "k", test_func)
+    stale_job = _finished_job(mock_queue.enqueue_call.call_args)
+    
+    # The claim expires while the first job still waits in a backed-up queue
+    dedupe_claims.clear()
+    second = redis_backend.enqueue_unique("healing", "k", test_func)
+    _release_dedupe_claim(stale_job, redis_backend.redis_conn, None)
+    
+    assert dedupe_claims["doc_healing:dedupe:healing:k"] == second.id
+    assert redis_backend.enqueue_unique("healing", "k", test_func) is None
+
+
+def test_init_preloads_peek_script(redis_backend):
+    """Test that the peek script is loaded up front, not on the first get_task."""
+    redis_backend.redis_conn.script_load.assert_called_once()
+    assert "LINDEX" in redis_backend.redis_conn.script_load.call_args.args[0]
+
+
+def test_init_tolerates_script_load_failure(mock_redis, mock_queue):
+    """Test that an unreachable Redis does not fail backend construction."""
+    from redis.exceptions import ConnectionError as RedisConnectionError
+    
+    mock_redis.script_load.side_effect = RedisConnectionError("down")
+    backend = RedisQueueBackend()
+    
+    assert backend.redis_conn is mock_redis
@@ -0,0 +1,86 @@
+"""Tests for Redis client configuration."""
+
+import sys
+from unittest.mock import patch
+
+from doc_healing.config import Settings
+from doc_healing.queue.redis_client import create_connection_pool, get_redis_client
+
+
+def test_connection_pool_uses_settings():
+    """Test that the pool is sized and timed out from settings."""
+    settings = Settings(redis_host="redis.local", redis_port=6380, redis_db=2, redis_pool_size=12)
+
+    pool = create_connection_pool(settings)
+
+    assert pool.max_connections == 12
+    assert pool.connection_kwargs["host"] == "redis.local"
+    assert pool.connection_kwargs["port"] == 6380
+    assert pool.connection_kwargs["db"] == 2
+    assert pool.connection_kwargs["socket_timeout"] == settings.redis_socket_timeout
+    assert pool.connection_kwargs["decode_responses"] is False
+
+
+def test_connection_pool_password_from_settings(monkeypatch):
+    """Test that the password setting wins over the bare REDIS_PASSWORD variable."""
+    monkeypatch.setenv("REDIS_PASSWORD", "legacy")
+
+    assert create_connection_pool(Settings(redis_password="s3cret")).connection_kwargs["password"] == "s3cret"
+    assert create_connection_pool(Settings()).connection_kwargs["password"] == "legacy"
+
+
+def test_connection_pool_from_url():
+    """Test that redis_url takes precedence over host settings."""
+    settings = Settings(redis_url="redis://cache.example.com:6390/3", redis_host="ignored")
+
+    pool = create_connection_pool(settings, decode_responses=True)
+
+    assert pool.connection_kwargs["host"] == "cache.example.com"
+    assert pool.connection_kwargs["port"] == 6390
+    assert pool.connection_kwargs["db"] == 3
+    assert pool.connection_kwargs["decode_responses"] is True
+
+
+def test_long_polling_pool_leaves_socket_timeout_unset():
+    """Test that worker pools let RQ choose a timeout above its BLPOP wait."""
+    pool = create_connection_pool(Settings(), long_polling=True)
+
+    assert "socket_timeout" not in pool.connection_kwargs
+
+
+def test_connection_pool_prefers_unix_socket():
+    """Test that a configured UNIX socket bypasses TCP settings."""
+    from redis.connection import UnixDomainSocketConnection
+
+    settings = Settings(redis_unix_socket="/var/run/redis.sock", redis_db=1, redis_url="redis://x:1/0")
+
+    pool = create_connection_pool(settings)
+
+    assert pool.connection_class is UnixDomainSocketConnection
+    assert pool.connection_kwargs["path"] == "/var/run/redis.sock"
+    assert pool.connection_kwargs["db"] == 1
+    assert "socket_keepalive" not in pool.connection_kwargs
+
+
+def test_tcp_pool_enables_keepalive():
+    """Test that TCP pools keep idle sockets alive."""
+    pool = create_connection_pool(Settings())
+
+    assert pool.connection_kwargs["socket_keepalive"] is True
+
+
+def test_redis_client_is_shared_and_bytes_mode(monkeypatch):
+    """Test that queues and caches share one non-decoding client built from settings."""
+    # The package re-exports a redis_client attribute, so reach the module directly
+    monkeypatch.setattr(sys.modules["doc_healing.queue.redis_client"], "redis_client", None)
+    settings = Settings(redis_host="redis.example.com", redis_port=6380, redis_db=1)
+
+    with patch("doc_healing.queue.redis_client.get_settings", return_value=settings):
+        conn = get_redis_client()
+
+    assert get_redis_client() is conn
+    kwargs = conn.connection_pool.connection_kwargs
+    assert kwargs["host"] == "redis.example.com"
+    assert kwargs["port"] == 6380
+    assert kwargs["db"] == 1
+    assert kwargs["decode_responses"] is False
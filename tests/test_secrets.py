@@ -0,0 +1,76 @@
+"""Tests for AWS Secrets Manager helpers."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from doc_healing.aws import secrets
+
+
+@pytest.fixture(autouse=True)
+def clear_secret_caches():
+    """Reset cached clients and secrets around each test."""
+    secrets._client.cache_clear()
+    secrets._cache.clear()
+    yield
+    secrets._client.cache_clear()
+    secrets._cache.clear()
+
+
+@pytest.fixture
+def mock_client():
+    """Patch boto3 so every session hands out the same mock client."""
+    client = MagicMock()
+    client.get_secret_value.return_value = {"SecretString": '{"DATABASE_URL": "postgresql://db"}'}
+    with patch("doc_healing.aws.secrets.boto3.session.Session") as mock_session:
+        mock_session.return_value.client.return_value = client
+        yield client
+
+
+def test_get_secret_parses_json(mock_client):
+    """Test that JSON secrets are decoded into a dict."""
+    assert secrets.get_secret("app", region_name="us-east-1") == {"DATABASE_URL": "postgresql://db"}
+
+
+def test_get_secret_wraps_plain_strings(mock_client):
+    """Test that non-JSON secrets are wrapped under a value key."""
+    mock_client.get_secret_value.return_value = {"SecretString": "plain-token"}
+
+    assert secrets.get_secret("token", region_name="us-east-1") == {"value": "plain-token"}
+
+
+def test_get_secret_is_fetched_once(mock_client):
+    """Test that repeated lookups reuse the client and the cached secret."""
+    first = secrets.get_secret("app", region_name="us-east-1")
+    first["DATABASE_URL"] = "mutated"
+    second = secrets.get_secret("app", region_name="us-east-1")
+
+    assert mock_client.get_secret_value.call_count == 1
+    assert second == {"DATABASE_URL": "postgresql://db"}
+
+
+def test_stale_secret_is_served_while_refreshing(mock_client, monkeypatch):
+    """Test that an expired entry is returned immediately and refreshed once."""
+    secrets.get_secret("app", region_name="us-east-1")
+    mock_client.get_secret_value.return_value = {"SecretString": '{"DATABASE_URL": "postgresql://rotated"}'}
+    monkeypatch.setattr(secrets._cache, "_ttl", 0)
+
+    stale = secrets.get_secret("app", region_name="us-east-1")
+    secrets._cache._executor.shutdown(wait=True)
+    secrets._cache._executor = None
+    fresh = secrets.get_secret("app", region_name="us-east-1")
+
+    assert stale == {"DATABASE_URL": "postgresql://db"}
+    assert fresh == {"DATABASE_URL": "postgresql://rotated"}
+
+
+def test_failed_refresh_keeps_stale_secret(mock_client, monkeypatch):
+    """Test that a refresh error does not evict the cached secret."""
+    secrets.get_secret("app", region_name="us-east-1")
+    mock_client.get_secret_value.side_effect = RuntimeError("throttled")
+    monkeypatch.setattr(secrets._cache, "_ttl", 0)
+
+    secrets.get_secret("app", region_name="us-east-1")
+    secrets._cache._executor.shutdown(wait=True)
+    secrets._cache._executor = None
+
+    assert secrets.get_secret("app", region_name="us-east-1") == {"DATABASE_URL": "postgresql://db"}
@@ -88,6 +88,25 @@ def test_unified_worker_start_sync_mode(mock_settings_sync):
             thread.join(timeout=1.0)
 
 
+def test_unified_worker_stop_wakes_run_loop_immediately(mock_settings_sync):
+    """Test that stop() releases the blocked run loop without a polling delay."""
+    with patch('doc_healing.workers.unified.get_settings', return_value=mock_settings_sync):
+        with patch('doc_healing.workers.unified.get_queue_backend') as mock_backend:
+            mock_backend.return_value = MagicMock(spec=MemoryQueueBackend)
+            
+            worker = UnifiedWorker()
+            thread = threading.Thread(target=worker.start, daemon=True)
+            thread.start()
+            time.sleep(0.1)
+            
+            started = time.monotonic()
+            worker.stop()
+            thread.join(timeout=1.0)
+            
+            assert not thread.is_alive()
+            assert time.monotonic() - started < 0.5
+
+
 def test_unified_worker_start_async_mode(mock_settings_async):
     """Test that worker starts correctly in asynchronous mode."""
     with patch('doc_healing.workers.unified.get_settings', return_value=mock_settings_async):
@@ -170,8 +189,8 @@ def test_unified_worker_signal_handler(mock_settings_sync):
             assert worker.running is False
 
 
-def test_unified_worker_monitors_thread_health(mock_settings_async):
-    """Test that worker monitors thread health in async mode."""
+def test_unified_worker_does_not_poll_thread_health(mock_settings_async):
+    """Test that the async monitor parks instead of scanning worker threads."""
     with patch('doc_healing.workers.unified.get_settings', return_value=mock_settings_async):
         with patch('doc_healing.workers.unified.get_queue_backend') as mock_backend:
             # Create a mock backend with some dead workers
@@ -192,16 +211,15 @@ def test_unified_worker_monitors_thread_health(mock_settings_async):
             thread = threading.Thread(target=start_worker, daemon=True)
             thread.start()
             
-            # Wait for monitoring to occur
-            time.sleep(6)  # Monitoring happens every 5 seconds
+            time.sleep(0.2)
             
             # Stop worker
             worker.stop()
             thread.join(timeout=1.0)
             
-            # Verify is_alive was called on workers
-            assert alive_worker.is_alive.called
-            assert dead_worker.is_alive.called
+            assert not thread.is_alive()
+            assert not alive_worker.is_alive.called
+            assert not dead_worker.is_alive.called
 
 
 def test_unified_worker_redis_mode_placeholder(mock_settings_async):
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
+from doc_healing.workers import tasks
 from doc_healing.workers.tasks import (
     process_github_webhook,
     process_gitlab_webhook,
@@ -13,6 +14,18 @@ from doc_healing.workers.tasks import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_result_caches(monkeypatch):
+    """Keep cached validation and healing results from leaking between tests."""
+    # Keeps the caches in-process instead of trying a local Redis
+    monkeypatch.setenv("DOC_HEALING_QUEUE_BACKEND", "memory")
+    tasks._validation_results.clear()
+    tasks._heal_results.clear()
+    yield
+    tasks._validation_results.clear()
+    tasks._heal_results.clear()
+
+
 @pytest.fixture
 def mock_queue_backend():
     """Mock queue backend for testing."""
@@ -47,6 +60,15 @@ class TestWebhookTasks:
         # Should log warning but not raise exception
         process_github_webhook(payload)
 
+    def test_process_github_webhook_ignored_action_skips_settings(self, mock_queue_backend):
+        """Test that ignored PR actions return before loading settings."""
+        payload = {"action": "closed", "pull_request": {"number": 1}}
+        
+        with patch('doc_healing.workers.tasks.get_settings') as mock_settings:
+            process_github_webhook(payload)
+        
+        mock_settings.assert_not_called()
+
     def test_process_gitlab_webhook_success(self, mock_queue_backend):
         """Test successful GitLab webhook processing."""
         payload = {
@@ -95,6 +117,68 @@ class TestValidationTasks:
         assert result["valid"] is False
         assert len(result["errors"]) > 0
 
+    @patch('doc_healing.workers.tasks.execute_code')
+    @patch('doc_healing.workers.tasks.analyze_code')
+    def test_validate_code_snippet_reuses_cached_checks(self, mock_analyze, mock_execute, mock_queue_backend):
+        """Test that identical code is analyzed and executed only once."""
+        mock_analyze.return_value = {"has_issues": True, "errors": [{"type": "NameError", "message": "x"}]}
+        mock_execute.return_value = {"skipped": True}
+        
+        first = validate_code_snippet("docs/a.md", "s-1", "print(x)", "python")
+        second = validate_code_snippet("docs/b.md", "s-2", "print(x)", "python")
+        
+        mock_analyze.assert_called_once()
+        mock_execute.assert_called_once()
+        assert second["errors"] == first["errors"] == ["NameError: x"]
+        assert second["snippet_id"] == "s-2"
+        # Healing is still requested for each invalid snippet
+        assert mock_queue_backend.enqueue_unique.call_count == 2
+
+    @patch('doc_healing.workers.tasks.execute_code')
+    @patch('doc_healing.workers.tasks.analyze_code')
+    def test_validate_code_snippet_logs_sandbox_success(self, mock_analyze, mock_execute,
+                                                        mock_queue_backend, caplog):
+        """Test that a clean sandbox run is logged at info level with the snippet ID."""
+        mock_analyze.return_value = {"has_issues": False, "errors": []}
+        mock_execute.return_value = {"skipped": False, "success": True}
+        
+        with caplog.at_level("INFO", logger="doc_healing.workers.tasks"):
+            validate_code_snippet("docs/a.md", "s-1", "x = 1", "python")
+        
+        assert "Sandbox execution succeeded for s-1" in caplog.messages
+
+    @patch('doc_healing.workers.tasks.execute_code')
+    @patch('doc_healing.workers.tasks.analyze_code')
+    def test_validate_code_snippet_caches_in_own_redis_namespace(self, mock_analyze, mock_execute,
+                                                                 mock_queue_backend, monkeypatch):
+        """Test that validation results go to the shared cache under their own keys."""
+        monkeypatch.setenv("DOC_HEALING_QUEUE_BACKEND", "redis")
+        mock_analyze.return_value = {"has_issues": False, "errors": []}
+        mock_execute.return_value = {"skipped": True}
+        redis = MagicMock()
+        redis.get.return_value = None
+        
+        with patch('doc_healing.queue.redis_client.get_redis_client', return_value=redis):
+            validate_code_snippet("docs/a.md", "s-1", "x = 1", "python")
+        
+        key = redis.set.call_args.args[0]
+        assert key.startswith("doc_healing:validation:")
+        assert redis.set.call_args.kwargs["ex"] == tasks.VALIDATION_CACHE_TTL_SECONDS
+
+    @patch('doc_healing.workers.tasks.execute_code')
+    @patch('doc_healing.workers.tasks.analyze_code')
+    def test_validate_code_snippet_dedupes_per_code_version(self, mock_analyze, mock_execute, mock_queue_backend):
+        """Test that an edited snippet is not deduplicated against its old version."""
+        mock_analyze.return_value = {"has_issues": True, "errors": [{"type": "NameError", "message": "x"}]}
+        mock_execute.return_value = {"skipped": True}
+        
+        validate_code_snippet("docs/a.md", "s-1", "print(x)", "python")
+        validate_code_snippet("docs/a.md", "s-1", "print(x + 1)", "python")
+        
+        keys = [c.args[1] for c in mock_queue_backend.enqueue_unique.call_args_list]
+        assert all(key.startswith("docs/a.md:s-1:") for key in keys)
+        assert keys[0] != keys[1]
+
     def test_validate_code_snippet_missing_parameters(self, mock_queue_backend):
         """Test validation with missing parameters."""
         with pytest.raises(ValueError, match="are required"):
@@ -116,6 +200,14 @@ class TestValidationTasks:
         assert result["snippets_found"] == 1
         assert result["status"] == "enqueued"
 
+    def test_validate_documentation_file_without_snippets_skips_queue(self):
+        """Test that a file with no code blocks never acquires the queue backend."""
+        with patch('doc_healing.workers.tasks.get_queue_backend') as mock_get:
+            result = validate_documentation_file(file_path="docs/prose.md", content="# Just prose")
+        
+        assert result["snippets_found"] == 0
+        mock_get.assert_not_called()
+
     def test_validate_documentation_file_missing_parameters(self, mock_queue_backend):
         """Test validation with missing parameters."""
         with pytest.raises(ValueError, match="are required"):
@@ -142,6 +234,44 @@ class TestHealingTasks:
         assert "changes" in result
         assert "confidence" in result
 
+    @patch('doc_healing.workers.tasks.BedrockLLMClient')
+    def test_heal_code_snippet_reuses_cached_result(self, mock_bedrock_cls, mock_queue_backend):
+        """Test that an unchanged snippet and error list skip Bedrock on re-runs."""
+        mock_bedrock_cls.return_value.generate_correction.return_value = "x = 1"
+        
+        first = heal_code_snippet("docs/a.md", "snippet-1", "x = 1\n", "python", ["NameError"])
+        second = heal_code_snippet("docs/b.md", "snippet-2", "x = 1\n", "python", ["NameError"])
+        # Error order does not matter for reuse
+        heal_code_snippet("docs/c.md", "snippet-3", "y = 2\n", "python", ["B", "A"])
+        heal_code_snippet("docs/c.md", "snippet-3", "y = 2\n", "python", ["A", "B"])
+        
+        assert mock_bedrock_cls.return_value.generate_correction.call_count == 2
+        prompt = mock_bedrock_cls.return_value.generate_correction.call_args.kwargs["prompt"]
+        assert "A\nB" in prompt
+        assert second["snippet_id"] == "snippet-2"
+        assert second["file_path"] == "docs/b.md"
+        assert {k: v for k, v in second.items() if k not in ("snippet_id", "file_path")} == {
+            k: v for k, v in first.items() if k not in ("snippet_id", "file_path")
+        }
+
+    def test_heal_code_snippet_skips_cache_when_bedrock_fails(self, mock_queue_backend):
+        """Test that a result degraded by a Bedrock error is not cached."""
+        from botocore.exceptions import ClientError
+        
+        bedrock = MagicMock()
+        bedrock.converse.side_effect = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "Converse"
+        )
+        with patch('doc_healing.llm.bedrock_client._get_bedrock_client', return_value=bedrock):
+            result = heal_code_snippet("docs/a.md", "snippet-1", "x = 1\n", "python", ["NameError"])
+            assert result["healed"] is False
+            # Primary model, then the fallback
+            assert bedrock.converse.call_count == 2
+            
+            # Nothing was cached, so a re-run asks Bedrock again
+            heal_code_snippet("docs/a.md", "snippet-1", "x = 1\n", "python", ["NameError"])
+            assert bedrock.converse.call_count == 4
+
     def test_heal_code_snippet_missing_parameters(self, mock_queue_backend):
         """Test healing with missing parameters."""
         with pytest.raises(ValueError, match="are required"):
@@ -185,6 +315,51 @@ class TestHealingTasks:
         assert "snippets_failed" in result
         assert "pull_request_url" in result
 
+    def test_heal_documentation_file_batches_enqueues(self, mock_queue_backend):
+        """Test that all healable snippets are enqueued in one batch."""
+        validation_results = {
+            "invalid_snippets": [
+                {"snippet_id": "s-1", "code": "x = 1", "language": "python", "errors": []},
+                {"snippet_id": "s-2", "code": "", "language": "python"},
+                {"snippet_id": "s-3", "code": "y = 2", "language": "python", "errors": []},
+            ],
+        }
+        
+        result = heal_documentation_file("docs/example.md", validation_results)
+        
+        assert result["snippets_healed"] == 2
+        assert result["snippets_failed"] == 1
+        mock_queue_backend.enqueue.assert_not_called()
+        queue_name, jobs = mock_queue_backend.enqueue_many.call_args.args
+        assert queue_name == "healing"
+        assert [job[1][1] for job in jobs] == ["s-1", "s-3"]
+
+    def test_heal_documentation_file_overlaps_heals_in_sync_mode(self, mock_queue_backend, monkeypatch):
+        """Test that sync-mode heals run concurrently instead of one after another."""
+        import time
+        
+        monkeypatch.setenv("DOC_HEALING_SYNC_PROCESSING", "true")
+        monkeypatch.setenv("DOC_HEALING_QUEUE_BACKEND", "memory")
+        healed = []
+        
+        def slow_heal(file_path, snippet_id, code, language, errors):
+            time.sleep(0.2)
+            healed.append(snippet_id)
+        
+        validation_results = {
+            "invalid_snippets": [
+                {"snippet_id": f"s-{i}", "code": "x = 1", "language": "python"} for i in range(4)
+            ],
+        }
+        
+        started = time.monotonic()
+        with patch('doc_healing.workers.tasks.heal_code_snippet', slow_heal):
+            heal_documentation_file("docs/example.md", validation_results)
+        
+        assert sorted(healed) == ["s-0", "s-1", "s-2", "s-3"]
+        assert time.monotonic() - started < 0.6
+        mock_queue_backend.enqueue_many.assert_not_called()
+
     def test_heal_documentation_file_missing_parameters(self, mock_queue_backend):
         """Test healing with missing parameters."""
         with pytest.raises(ValueError, match="are required"):